@@ -17,7 +17,6 @@ current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
 from vtt_summarizer.config import Config
-from vtt_summarizer.meeting_processor import MeetingProcessor
 
 
 def setup_logging(verbose=False):
@@ -248,6 +247,9 @@ def main():
         # Initialize and run processor
         print("🚀 Starting meeting processing...")
         
+        # Imported here so --help and config errors don't pay for boto3/OpenCV
+        from vtt_summarizer.meeting_processor import MeetingProcessor
+        
         processor = MeetingProcessor(
             config,
             enable_keyframes=keyframes_enabled,
@@ -0,0 +1,121 @@
+"""Tests for the consolidated markdown built by ReportGenerator."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vtt_summarizer.config import Config
+from vtt_summarizer.file_writer import FileWriter
+from vtt_summarizer.report_generator import ChapterMeta, ReportGenerator
+
+PNG_HEADER = b'\x89PNG\r\n\x1a\n'
+
+
+@pytest.fixture
+def summaries_path(tmp_path):
+    """Summaries directory with one valid and one corrupt keyframe image."""
+    images = tmp_path / "images"
+    images.mkdir()
+    (images / "meeting_summary_1.png").write_bytes(PNG_HEADER)
+    (images / "meeting_summary_2.png").write_bytes(b'not an image')
+    return tmp_path
+
+
+def write_summary(summaries_path, image_names):
+    """Write a summary with one screenshot per image name and return its text."""
+    screenshots = [
+        SimpleNamespace(
+            timestamp_formatted=f"00:0{i}:00",
+            image_path=str(summaries_path / "images" / name),
+            context_text=f"context {i}"
+        )
+        for i, name in enumerate(image_names, 1)
+    ]
+    metadata = {"duration_formatted": "00:30:00", "word_count": 1234, "file_path": "meeting.vtt"}
+    summary_path = summaries_path / "meeting_summary.md"
+    FileWriter().write_individual_summary(summary_path, "## Participants\n- Jane", metadata, "meeting", screenshots)
+    return summary_path.read_text()
+
+
+def test_broken_screenshot_block_is_dropped_whole(summaries_path):
+    content = write_summary(summaries_path, ["meeting_summary_1.png", "meeting_summary_2.png"])
+    
+    cleaned = ReportGenerator(Config())._clean_summary_content(content, base_path=summaries_path)
+    
+    assert "## Meeting Screenshots" in cleaned
+    assert "### Screenshot 1: At 00:01:00" in cleaned
+    assert "![At 00:01:00](./images/meeting_summary_1.png)" in cleaned
+    assert "*Context: context 1*" in cleaned
+    assert "Screenshot 2" not in cleaned
+    assert "meeting_summary_2.png" not in cleaned
+    assert "context 2" not in cleaned
+    assert "## Summary" in cleaned
+
+
+def test_screenshot_section_without_valid_images_is_dropped(summaries_path):
+    content = write_summary(summaries_path, ["meeting_summary_2.png", "missing.png"])
+    
+    cleaned = ReportGenerator(Config())._clean_summary_content(content, base_path=summaries_path)
+    
+    assert "Meeting Screenshots" not in cleaned
+    assert "Key visual moments" not in cleaned
+    assert "Screenshot" not in cleaned
+    assert "Context:" not in cleaned
+    assert cleaned.startswith("# Meeting - Meeting Summary")
+    assert "## Summary\n\n## Participants\n- Jane" in cleaned
+
+
+def test_image_references_kept_without_base_path(summaries_path):
+    content = write_summary(summaries_path, ["missing.png"])
+    
+    cleaned = ReportGenerator(Config())._clean_summary_content(content)
+    
+    assert "### Screenshot 1: At 00:01:00" in cleaned
+    assert "![At 00:01:00](./images/missing.png)" in cleaned
+
+
+def test_chapter_content_follows_image_changes(summaries_path):
+    write_summary(summaries_path, ["meeting_summary_2.png"])
+    generator = ReportGenerator(Config())
+    
+    def load():
+        chapter = ChapterMeta(
+            topic="Meeting", date=None, duration=None, participants=(),
+            summary_path=summaries_path / "meeting_summary.md", folder_name="meeting"
+        )
+        return generator._load_chapter_content(chapter, summaries_path).decode('utf-8')
+    
+    assert "Screenshot 1" not in load()
+    
+    # Fixing the image alone, with the summary untouched, brings the block back
+    (summaries_path / "images" / "meeting_summary_2.png").write_bytes(PNG_HEADER + b'fixed')
+    assert "![At 00:01:00](./images/meeting_summary_2.png)" in load()
+    
+    (summaries_path / "images" / "meeting_summary_2.png").unlink()
+    assert "Screenshot 1" not in load()
+
+
+def test_cleaning_splits_on_newlines_only():
+    content = "## Summary\n\nPage one\fpage two same line\x85still the same"
+    
+    cleaned = ReportGenerator(Config())._clean_summary_content(content)
+    
+    assert cleaned == content
+
+
+def test_blank_lines_collapse_outside_code_blocks_only():
+    content = (
+        "## Summary\n\n\n\nIntro\n\n"
+        "```\nfirst\n\n\nsecond\n```\n\n\n"
+        "~~~\na\n\n\n```\nb\n~~~\n\n"
+        "    indented\n\n\n    code\n\n\nEnd"
+    )
+    
+    cleaned = ReportGenerator(Config())._clean_summary_content(content)
+    
+    assert cleaned == (
+        "## Summary\n\nIntro\n\n"
+        "```\nfirst\n\n\nsecond\n```\n\n"
+        "~~~\na\n\n\n```\nb\n~~~\n\n"
+        "    indented\n\n\n    code\n\n\nEnd"
+    )
@@ -123,7 +123,7 @@ class AIClient:
             ValueError: If the response is invalid
         """
         # Start timing if we have a performance tracker
-        start_time = self.performance_tracker.start_call(stats_context) if self.performance_tracker else time.time()
+        start_time = self.performance_tracker.start_call(stats_context) if self.performance_tracker else time.monotonic()
         
         try:
             response_text = self._invoke_model(prompt)
@@ -79,6 +79,11 @@ class Config:
         """Get input file patterns to search for."""
         return self._config.get('processing', {}).get('input_file_patterns', ['*.vtt'])
     
+    @property
+    def max_concurrency(self) -> int:
+        """Get maximum number of meetings processed concurrently."""
+        return self._config.get('processing', {}).get('max_concurrency', 1)
+    
     @property
     def summary_style(self) -> str:
         """Get summary style."""
@@ -181,6 +186,11 @@ class Config:
         """Get whether to include keyframes in PDF."""
         return self._config.get('pdf', {}).get('include_keyframes', True)
     
+    @property
+    def pdf_keep_markdown(self) -> bool:
+        """Get whether to keep the consolidated markdown next to the PDF."""
+        return self._config.get('pdf', {}).get('keep_markdown', True)
+    
     @property
     def pdf_page_size(self) -> str:
         """Get PDF page size."""
@@ -1,14 +1,18 @@
 """File writer for creating meeting summaries and analysis documents."""
 
+import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 
 from .utils import (
     safe_write_file, 
     format_timestamp, 
+    format_folder_title,
     calculate_total_transcript_words
 )
-from .video_processor import ExtractedKeyframe
+
+if TYPE_CHECKING:
+    from .video_processor import ExtractedKeyframe
 
 
 class FileWriter:
@@ -16,7 +20,7 @@ class FileWriter:
     
     def write_individual_summary(self, summary_path: Path, summary: str, 
                                 metadata: Dict, folder_name: str,
-                                video_screenshots: Optional[List[ExtractedKeyframe]] = None) -> None:
+                                video_screenshots: Optional[List['ExtractedKeyframe']] = None) -> None:
         """
         Write an individual meeting summary to a markdown file.
         
@@ -28,12 +32,12 @@ class FileWriter:
             video_screenshots: Optional list of extracted video screenshots to embed
         """
         content_parts = [
-            f"# {folder_name.replace('_', ' ').title()} - Meeting Summary\n",
+            f"# {format_folder_title(folder_name)} - Meeting Summary\n",
             "## Meeting Information\n",
             f"- **Date Generated**: {format_timestamp()}",
             f"- **Duration**: {metadata['duration_formatted']}",
             f"- **Transcript Words**: {metadata['word_count']:,}",
-            f"- **Source File**: {Path(metadata['file_path']).name}\n"
+            f"- **Source File**: {os.path.basename(metadata['file_path'])}\n"
         ]
         
         # Add video screenshots section if available
@@ -52,7 +56,7 @@ class FileWriter:
         content = "\n".join(content_parts)
         safe_write_file(summary_path, content)
     
-    def _generate_screenshots_section(self, video_screenshots: List[ExtractedKeyframe]) -> str:
+    def _generate_screenshots_section(self, video_screenshots: List['ExtractedKeyframe']) -> str:
         """
         Generate markdown content for video screenshots section.
         
@@ -62,26 +66,14 @@ class FileWriter:
         Returns:
             Formatted markdown content for video screenshots
         """
-        screenshot_parts = []
-        
-        screenshot_parts.append("*Key visual moments from the meeting:*\n")
-        
-        for i, frame in enumerate(video_screenshots, 1):
-            # Get relative path for the image (assuming images are in images/ subdirectory)
-            image_filename = Path(frame.image_path).name
-            image_relative_path = f"images/{image_filename}"
-            
-            # Format timestamp for display
-            timestamp_display = f"At {frame.timestamp_formatted}"
-            
-            # Create markdown for this screenshot
-            screenshot_parts.extend([
-                f"### Screenshot {i}: {timestamp_display}\n",
-                f"![{timestamp_display}]({image_relative_path})\n",
-                f"*Context: {frame.context_text.strip()}*\n"
-            ])
-        
-        return "\n".join(screenshot_parts)
+        # One formatted block per screenshot (images live in the images/ subdirectory),
+        # each preceded by the blank line that separates it from the previous block
+        return "*Key visual moments from the meeting:*\n" + "".join(
+            f"\n### Screenshot {i}: At {frame.timestamp_formatted}\n\n"
+            f"![At {frame.timestamp_formatted}](images/{os.path.basename(frame.image_path)})\n\n"
+            f"*Context: {frame.context_text.strip()}*\n"
+            for i, frame in enumerate(video_screenshots, 1)
+        )
     
     def write_global_summary(self, global_analysis_path: Path, content: str, 
                             summaries: List[Dict]) -> None:
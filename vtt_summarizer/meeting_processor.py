@@ -1,15 +1,22 @@
 """Main meeting processor that handles individual summaries and global analysis."""
 
+import os
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import asyncio
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from collections import deque
+from datetime import datetime
+from itertools import islice
 
 from .config import Config
-from .transcript_parser import TranscriptParser
+from .transcript_parser import TranscriptParser, parse_transcript_file
 from .ai_client import AIClient
 from .meeting_analyzer import MeetingAnalyzer
 from .file_writer import FileWriter
-from .video_processor import VideoProcessor
 from .report_generator import ReportGenerator
 from .performance_tracker import PerformanceTracker
 from .utils import (
@@ -24,6 +31,30 @@ from .utils import (
 )
 
 
+@dataclass
+class MeetingResult:
+    """Outcome of processing a single meeting folder."""
+    folder: str
+    status: str
+    message: Optional[str] = None
+    error: Optional[str] = None
+    summary_path: Optional[str] = None
+    transcript_stats: Optional[Dict[str, any]] = None
+    processing_time: Optional[Dict[str, float]] = None
+    model_stats: Optional[Dict[str, any]] = None
+    keyframes_extracted: Optional[int] = None
+    timestamp: str = field(default_factory=get_iso_timestamp)
+    
+    def to_dict(self) -> Dict[str, any]:
+        """
+        Get the result as a plain dictionary.
+        
+        Every field is present whatever the status, with unset ones as None,
+        so skipped and failed results carry the same keys as successful ones.
+        """
+        return asdict(self)
+
+
 class MeetingProcessor:
     """Processes meeting transcripts and generates individual summaries and global analysis."""
     
@@ -47,6 +78,9 @@ class MeetingProcessor:
         
         # Initialize video processor only if enabled
         if self.enable_keyframes:
+            # OpenCV/PIL/numpy are only loaded when keyframes are actually wanted
+            from .video_processor import VideoProcessor
+            
             # Use configuration values with CLI overrides
             config_delays = self.config.keyframes_delays
             self.video_processor = VideoProcessor(
@@ -80,12 +114,11 @@ class MeetingProcessor:
         Returns:
             Formatted filename string
         """
-        import datetime
-        
-        # Add standard variables
+        # Add standard variables, both taken from a single clock read
+        now = datetime.now()
         format_vars = {
-            'timestamp': get_iso_timestamp().replace(':', '-').replace('T', '_'),
-            'date': datetime.datetime.now().strftime('%Y-%m-%d'),
+            'timestamp': now.isoformat().replace(':', '-').replace('T', '_'),
+            'date': now.strftime('%Y-%m-%d'),
             **kwargs
         }
         
@@ -216,35 +249,197 @@ class MeetingProcessor:
             "total_folders": len(meeting_folders)
         }
         
-        # Process each folder
-        for folder_path, meeting_file in meeting_folders:
-            try:
-                result = self._process_single_meeting(folder_path, meeting_file, summaries_path, force_overwrite)
-                results["results"].append(result)
-                
-                if result["status"] == "success":
-                    results["processed"] += 1
-                elif result["status"] == "skipped":
-                    results["skipped"] += 1
-                else:
-                    results["errors"] += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Unexpected error processing {folder_path}: {str(e)}")
+        # Settle folders that already have a summary up front, so they never
+        # take a worker slot or touch their transcript
+        outcomes: List[Union[MeetingResult, BaseException, None]] = [None] * len(meeting_folders)
+        pending = []
+        for index, (folder_path, _) in enumerate(meeting_folders):
+            skipped = None if force_overwrite else self._skip_existing_summary(folder_path.name, summaries_path)
+            if skipped is not None:
+                outcomes[index] = skipped
+            else:
+                pending.append(index)
+        
+        pending_folders = [meeting_folders[index] for index in pending]
+        
+        # Outcomes come back in folder order either way
+        if self.config.max_concurrency > 1 and len(pending_folders) > 1:
+            pending_outcomes = asyncio.run(
+                self._process_meetings_concurrently(pending_folders, summaries_path, force_overwrite)
+            )
+        else:
+            pending_outcomes = self._process_meetings_sequentially(pending_folders, summaries_path, force_overwrite)
+        
+        for index, outcome in zip(pending, pending_outcomes):
+            outcomes[index] = outcome
+        
+        for (folder_path, _), result in zip(meeting_folders, outcomes):
+            if isinstance(result, BaseException):
+                # Let interrupts through; anything else only fails this folder
+                if not isinstance(result, Exception):
+                    raise result
+                self.logger.error("Unexpected error processing %s: %s", folder_path, result)
+                result = MeetingResult(folder=str(folder_path), status="error", error=str(result))
+            
+            if result.status == "success":
+                results["processed"] += 1
+            elif result.status == "skipped":
+                results["skipped"] += 1
+            else:
                 results["errors"] += 1
-                results["results"].append({
-                    "folder": str(folder_path),
-                    "status": "error",
-                    "error": str(e),
-                    "timestamp": get_iso_timestamp()
-                })
+            
+            # Results leave the processor as plain dictionaries
+            results["results"].append(result.to_dict())
         
         results["end_time"] = get_iso_timestamp()
         
         return results
     
+    def _process_meetings_sequentially(
+        self,
+        meeting_folders: List[Tuple[Path, Path]],
+        summaries_path: Path,
+        force_overwrite: bool
+    ) -> List[Union[MeetingResult, BaseException]]:
+        """
+        Process meeting folders one at a time in the calling thread.
+        
+        Args:
+            meeting_folders: List of tuples (folder_path, meeting_file_path)
+            summaries_path: Path to summaries output directory
+            force_overwrite: Whether to overwrite existing files
+            
+        Returns:
+            Processing result or raised exception for each folder, in input order
+        """
+        outcomes = []
+        for folder_path, meeting_file in meeting_folders:
+            try:
+                outcomes.append(
+                    self._process_single_meeting(folder_path, meeting_file, summaries_path, force_overwrite)
+                )
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    async def _process_meetings_concurrently(
+        self,
+        meeting_folders: List[Tuple[Path, Path]],
+        summaries_path: Path,
+        force_overwrite: bool
+    ) -> List[Union[MeetingResult, BaseException]]:
+        """
+        Process meeting folders concurrently on a dedicated thread pool.
+        
+        At most ``max_concurrency`` meetings run at once, which bounds the
+        number of in-flight Bedrock calls; those calls release the GIL while
+        waiting on the network, so they overlap. Transcript parsing is
+        CPU-bound, so it runs in a process pool, but only one window of
+        ``max_concurrency`` transcripts is parsed ahead of the meetings being
+        processed, keeping memory flat however many folders there are.
+        
+        Args:
+            meeting_folders: List of tuples (folder_path, meeting_file_path)
+            summaries_path: Path to summaries output directory
+            force_overwrite: Whether to overwrite existing files
+            
+        Returns:
+            Processing result or raised exception for each folder, in input order
+        """
+        loop = asyncio.get_running_loop()
+        workers = min(self.config.max_concurrency, len(meeting_folders))
+        parse_workers = min(os.cpu_count() or 1, workers)
+        meeting_files = iter([str(meeting_file) for _, meeting_file in meeting_folders])
+        
+        with ProcessPoolExecutor(max_workers=parse_workers) as parse_pool:
+            # Fill the parse window before any worker threads exist, so every
+            # parse process is started up front and none is forked later
+            parses = deque(
+                parse_pool.submit(parse_transcript_file, path)
+                for path in islice(meeting_files, workers)
+            )
+            
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meeting") as executor:
+                futures = []
+                running = set()
+                for folder_path, meeting_file in meeting_folders:
+                    if len(running) >= workers:
+                        _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    
+                    parsed = parses.popleft()
+                    next_path = next(meeting_files, None)
+                    if next_path is not None:
+                        parses.append(parse_pool.submit(parse_transcript_file, next_path))
+                    
+                    future = loop.run_in_executor(
+                        executor, self._process_single_meeting_buffered,
+                        folder_path, meeting_file, summaries_path, force_overwrite, parsed
+                    )
+                    futures.append(future)
+                    running.add(future)
+                
+                return await asyncio.gather(*futures, return_exceptions=True)
+    
+    def _process_single_meeting_buffered(self, folder_path: Path, meeting_file: Path, summaries_path: Path,
+                                         force_overwrite: bool, parsed: Optional[Future] = None) -> MeetingResult:
+        """
+        Process a single meeting, printing its progress as one block once it finishes.
+        
+        Used when meetings run concurrently, so that progress lines of
+        different meetings don't interleave on the console.
+        
+        Args:
+            folder_path: Path to the meeting folder
+            meeting_file: Path to the meeting transcript file
+            summaries_path: Path to summaries output directory
+            force_overwrite: Whether to overwrite existing files
+            parsed: Optional future for a parse already running elsewhere
+            
+        Returns:
+            Processing result for the meeting
+        """
+        lines: List[str] = []
+        try:
+            return self._process_single_meeting(
+                folder_path, meeting_file, summaries_path, force_overwrite, parsed, lines.append
+            )
+        finally:
+            if lines:
+                print("\n".join(lines))
+    
+    def _skip_existing_summary(self, folder_name: str, summaries_path: Path,
+                               report: Callable[[str], None] = print) -> Optional[MeetingResult]:
+        """
+        Build the skipped result for a folder whose summary already exists.
+        
+        Args:
+            folder_name: Name of the meeting folder
+            summaries_path: Path to summaries output directory
+            report: Receives each console progress line
+            
+        Returns:
+            Skipped result, or None if the summary still has to be created
+        """
+        summary_filename = self._format_filename(self.config.individual_summary_filename, folder_name=folder_name)
+        summary_path = summaries_path / summary_filename
+        
+        if not summary_path.exists():
+            return None
+        
+        report(f"\n📁 Processing: {folder_name}")
+        report(f"   ⏭️  Already exists, skipping")
+        self.logger.info("Processing: %s", folder_name)
+        self.logger.info("Summary already exists for %s, skipping", folder_name)
+        return MeetingResult(
+            folder=folder_name,
+            status="skipped",
+            message="Summary file already exists",
+            summary_path=str(summary_path)
+        )
+    
     def _process_single_meeting(self, folder_path: Path, meeting_file: Path, summaries_path: Path, 
-                               force_overwrite: bool) -> Dict[str, any]:
+                               force_overwrite: bool, parsed: Optional[Future] = None,
+                               report: Callable[[str], None] = print) -> MeetingResult:
         """
         Process a single meeting file and save summary to summaries folder.
         
@@ -253,45 +448,45 @@ class MeetingProcessor:
             meeting_file: Path to the meeting transcript file
             summaries_path: Path to summaries output directory
             force_overwrite: Whether to overwrite existing files
+            parsed: Optional future for a parse already running elsewhere,
+                resolving to (transcript, metadata, segments)
+            report: Receives each console progress line
             
         Returns:
-            Dictionary with processing result
+            Processing result for the meeting
         """
         folder_name = folder_path.name
+        
+        # Check if summary already exists
+        if not force_overwrite:
+            skipped = self._skip_existing_summary(folder_name, summaries_path, report)
+            if skipped is not None:
+                return skipped
+        
         summary_filename = self._format_filename(self.config.individual_summary_filename, folder_name=folder_name)
         summary_path = summaries_path / summary_filename
         
         # Enhanced output for both verbose and default modes
-        print(f"\n📁 Processing: {folder_name}")
-        self.logger.info(f"Processing: {folder_name}")
-        
-        # Check if summary already exists
-        if summary_path.exists() and not force_overwrite:
-            print(f"   ⏭️  Already exists, skipping")
-            self.logger.info(f"Summary already exists for {folder_name}, skipping")
-            return {
-                "folder": folder_name,
-                "status": "skipped",
-                "message": "Summary file already exists",
-                "summary_path": str(summary_path),
-                "timestamp": get_iso_timestamp()
-            }
+        report(f"\n📁 Processing: {folder_name}")
+        self.logger.info("Processing: %s", folder_name)
         
         try:
             # Extract transcript and segments
-            print(f"   📄 Parsing transcript file: {meeting_file.name}")
-            self.logger.info(f"Parsing transcript file: {meeting_file.name}")
+            report(f"   📄 Parsing transcript file: {meeting_file.name}")
+            self.logger.info("Parsing transcript file: %s", meeting_file.name)
             start_time = time.time()
             
-            transcript = self.transcript_parser.extract_full_transcript(str(meeting_file))
-            segments = self.transcript_parser.parse_file(str(meeting_file))  # Get segments for keyframe extraction
-            metadata = self.transcript_parser.get_transcript_metadata(str(meeting_file))
+            # One parse yields the text, metadata and segments (for keyframe extraction)
+            if parsed is not None:
+                transcript, metadata, segments = parsed.result()
+            else:
+                transcript, metadata, segments = self.transcript_parser.parse_full(str(meeting_file))
             
             parse_time = time.time() - start_time
-            print(f"   ✅ Parsing complete: {metadata['word_count']} words, {metadata['duration_formatted']} duration ({parse_time:.2f}s)")
-            self.logger.info(f"Transcript parsing completed in {parse_time:.2f}s")
-            self.logger.info(f"Transcript stats: {metadata['word_count']} words, "
-                           f"{metadata['duration_formatted']} duration")
+            report(f"   ✅ Parsing complete: {metadata['word_count']} words, {metadata['duration_formatted']} duration ({parse_time:.2f}s)")
+            self.logger.info("Transcript parsing completed in %.2fs", parse_time)
+            self.logger.info("Transcript stats: %s words, %s duration",
+                             metadata['word_count'], metadata['duration_formatted'])
             
             # Extract keyframes if enabled and video file exists
             keyframes = []
@@ -301,8 +496,8 @@ class MeetingProcessor:
                 video_file = self._find_video_file(folder_path)
                 
                 if video_file:
-                    print(f"   🎥 Extracting keyframes from: {video_file.name}")
-                    self.logger.info(f"Extracting keyframes from: {video_file.name}")
+                    report(f"   🎥 Extracting keyframes from: {video_file.name}")
+                    self.logger.info("Extracting keyframes from: %s", video_file.name)
                     keyframe_start_time = time.time()
                     
                     images_dir = summaries_path / "images"
@@ -313,21 +508,21 @@ class MeetingProcessor:
                     )
                     
                     keyframe_time = time.time() - keyframe_start_time
-                    print(f"   ✅ Keyframes extracted: {len(keyframes)} frames ({keyframe_time:.2f}s)")
-                    self.logger.info(f"Keyframe extraction completed in {keyframe_time:.2f}s, "
-                                   f"extracted {len(keyframes)} frames")
+                    report(f"   ✅ Keyframes extracted: {len(keyframes)} frames ({keyframe_time:.2f}s)")
+                    self.logger.info("Keyframe extraction completed in %.2fs, extracted %d frames",
+                                     keyframe_time, len(keyframes))
                 else:
-                    print(f"   🎥 No video file found, skipping keyframes")
+                    report(f"   🎥 No video file found, skipping keyframes")
                     self.logger.info("No video file found, skipping keyframe extraction")
             else:
-                print(f"   🎥 Keyframe extraction disabled")
+                report(f"   🎥 Keyframe extraction disabled")
                 self.logger.info("Keyframe extraction disabled")
             
             # Generate meeting context
             meeting_context = extract_meeting_context(folder_name, metadata)
             
             # Generate summary
-            print(f"   🤖 Generating summary with Model...")
+            report(f"   🤖 Generating summary with Model...")
             self.logger.info("Generating summary with Model...")
             start_time = time.time()
             
@@ -338,44 +533,38 @@ class MeetingProcessor:
             # Get model statistics for this call
             model_stats = self.performance_tracker.get_individual_stats(folder_name)
             
-            print(f"   ✅ Summary generated ({generation_time:.2f}s)")
+            report(f"   ✅ Summary generated ({generation_time:.2f}s)")
             if model_stats:
-                print(self.performance_tracker.format_stats_for_display(model_stats))
+                report(self.performance_tracker.format_stats_for_display(model_stats))
             
-            self.logger.info(f"Summary generation completed in {generation_time:.2f}s")
+            self.logger.info("Summary generation completed in %.2fs", generation_time)
             
             # Save summary with keyframes
             self.file_writer.write_individual_summary(summary_path, summary, metadata, folder_name, keyframes)
             
-            print(f"   💾 Summary saved: {summary_filename}")
-            print(f"   ✅ Processing complete for {folder_name}")
-            self.logger.info(f"Successfully processed {folder_name}")
+            report(f"   💾 Summary saved: {summary_filename}")
+            report(f"   ✅ Processing complete for {folder_name}")
+            self.logger.info("Successfully processed %s", folder_name)
             
-            return {
-                "folder": folder_name,
-                "status": "success",
-                "summary_path": str(summary_path),
-                "transcript_stats": metadata,
-                "processing_time": {
+            return MeetingResult(
+                folder=folder_name,
+                status="success",
+                summary_path=str(summary_path),
+                transcript_stats=metadata,
+                processing_time={
                     "parse_time": round(parse_time, 2),
                     "keyframe_time": round(keyframe_time, 2),
                     "generation_time": round(generation_time, 2),
                     "total_time": round(parse_time + keyframe_time + generation_time, 2)
                 },
-                "model_stats": model_stats.__dict__ if model_stats else None,
-                "keyframes_extracted": len(keyframes),
-                "timestamp": get_iso_timestamp()
-            }
+                model_stats=model_stats.to_dict() if model_stats else None,
+                keyframes_extracted=len(keyframes)
+            )
             
         except Exception as e:
-            print(f"   ❌ Error processing {folder_name}: {str(e)}")
-            self.logger.error(f"Error processing {folder_name}: {str(e)}")
-            return {
-                "folder": folder_name,
-                "status": "error",
-                "error": str(e),
-                "timestamp": get_iso_timestamp()
-            }
+            report(f"   ❌ Error processing {folder_name}: {str(e)}")
+            self.logger.error("Error processing %s: %s", folder_name, e)
+            return MeetingResult(folder=folder_name, status="error", error=str(e))
     
     def _create_global_analysis(self, summaries_path: Path, force_overwrite: bool) -> Dict[str, any]:
         """
@@ -512,21 +701,40 @@ class MeetingProcessor:
             List of tuples (folder_path, meeting_file_path)
         """
         meeting_folders = []
-        
-        for item in input_path.iterdir():
-            if item.is_dir():
-                # Look for input files using configurable patterns
-                meeting_files = []
-                for pattern in self.config.input_file_patterns:
-                    meeting_files.extend(item.glob(pattern))
+        patterns = self.config.input_file_patterns
+        
+        # DirEntry.is_dir()/is_file() reuse the type from the directory listing,
+        # so no per-entry stat is needed; Paths are only built for matches
+        with os.scandir(input_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                
+                try:
+                    with os.scandir(entry.path) as children:
+                        file_names = [child.name for child in children if child.is_file()]
+                except OSError as e:
+                    # Unreadable folders (e.g. lost+found) are skipped, as Path.glob did
+                    self.logger.warning("Skipping unreadable folder %s: %s", entry.name, e)
+                    continue
+                
+                # Look for input files using configurable patterns (fnmatch follows
+                # the platform case rules, as Path.glob did)
+                meeting_files = [
+                    name
+                    for pattern in patterns
+                    for name in file_names
+                    if fnmatch(name, pattern)
+                ]
                 
                 if meeting_files:
                     # Use the first meeting file found (there should typically be only one)
-                    meeting_file = meeting_files[0]
+                    item = Path(entry.path)
+                    meeting_file = item / meeting_files[0]
                     meeting_folders.append((item, meeting_file))
                     
                     if len(meeting_files) > 1:
-                        self.logger.warning(f"Multiple meeting files found in {item.name}, using {meeting_file.name}")
+                        self.logger.warning("Multiple meeting files found in %s, using %s", item.name, meeting_file.name)
         
         return meeting_folders
     
@@ -1,19 +1,50 @@
 """Performance tracking for monitoring AI model usage, costs, and response times."""
 
 import time
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
-@dataclass
 class ModelCallStats:
     """Performance statistics for a single AI model call."""
-    tokens_used: int = 0
-    input_tokens: int = 0
-    output_tokens: int = 0
-    latency_ms: float = 0.0
-    model_id: str = ""
-    timestamp: float = field(default_factory=time.time)
+    
+    __slots__ = ('tokens_used', 'input_tokens', 'output_tokens', 'latency_ms', 'model_id', 'timestamp')
+    
+    def __init__(self, tokens_used: int = 0, input_tokens: int = 0, output_tokens: int = 0,
+                 latency_ms: float = 0.0, model_id: str = "", timestamp: Optional[float] = None):
+        self.tokens_used = tokens_used
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.latency_ms = latency_ms
+        self.model_id = model_id
+        # Defaults to creation time, as the dataclass field did
+        self.timestamp = time.time() if timestamp is None else timestamp
+    
+    @classmethod
+    def from_response(cls, response_data: Dict[str, Any], latency_ms: float) -> 'ModelCallStats':
+        """
+        Create statistics from a model response, timestamped now.
+        
+        Args:
+            response_data: Response data from the model API
+            latency_ms: Measured call latency in milliseconds
+            
+        Returns:
+            ModelCallStats with token usage taken from the response
+        """
+        usage = response_data.get('usage', {})
+        input_tokens = usage.get('input_tokens', 0)
+        output_tokens = usage.get('output_tokens', 0)
+        return cls(input_tokens + output_tokens, input_tokens, output_tokens, latency_ms,
+                   response_data.get('model_id', 'unknown'), time.time())
+    
+    def __repr__(self) -> str:
+        return (f"ModelCallStats(tokens_used={self.tokens_used}, input_tokens={self.input_tokens}, "
+                f"output_tokens={self.output_tokens}, latency_ms={self.latency_ms}, "
+                f"model_id={self.model_id!r}, timestamp={self.timestamp})")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get statistics as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
     
     @property
     def latency_seconds(self) -> float:
@@ -24,10 +55,14 @@ class ModelCallStats:
 class PerformanceTracker:
     """Tracks AI model performance metrics across the entire processing session."""
     
+    __slots__ = ('individual_calls', 'analysis_calls', '_all_stats', 'session_start')
+    
     def __init__(self):
         """Initialize the performance tracker."""
         self.individual_calls: Dict[str, ModelCallStats] = {}
         self.analysis_calls: Dict[str, ModelCallStats] = {}
+        # Flat view of the latest stats per context, for session-wide aggregation
+        self._all_stats: List[ModelCallStats] = []
         self.session_start = time.time()
     
     def start_call(self, context: str) -> float:
@@ -38,9 +73,9 @@ class PerformanceTracker:
             context: Context identifier (e.g., folder name or "global_summary")
             
         Returns:
-            Start time for measuring latency
+            Monotonic start time for measuring latency
         """
-        return time.time()
+        return time.monotonic()
     
     def record_call(self, context: str, start_time: float, response_data: Dict[str, Any], 
                    is_analysis: bool = False) -> ModelCallStats:
@@ -56,33 +91,22 @@ class PerformanceTracker:
         Returns:
             ModelCallStats object with recorded statistics
         """
-        end_time = time.time()
-        latency_ms = (end_time - start_time) * 1000
-        
         # Extract token usage from response (if available)
-        usage = response_data.get('usage', {})
-        input_tokens = usage.get('input_tokens', 0)
-        output_tokens = usage.get('output_tokens', 0)
-        total_tokens = input_tokens + output_tokens
+        stats = ModelCallStats.from_response(response_data, (time.monotonic() - start_time) * 1000)
         
         # If no usage data in response, estimate based on content
-        if total_tokens == 0:
-            total_tokens = self._estimate_tokens(response_data)
-        
-        stats = ModelCallStats(
-            tokens_used=total_tokens,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            latency_ms=latency_ms,
-            model_id=response_data.get('model_id', 'unknown'),
-            timestamp=end_time
-        )
+        if stats.tokens_used == 0:
+            stats.tokens_used = self._estimate_tokens(response_data)
         
         # Store in appropriate collection
-        if is_analysis:
-            self.analysis_calls[context] = stats
+        calls = self.analysis_calls if is_analysis else self.individual_calls
+        previous = calls.get(context)
+        calls[context] = stats
+        if previous is None:
+            self._all_stats.append(stats)
         else:
-            self.individual_calls[context] = stats
+            # A repeated context replaces its earlier stats, as in the dicts
+            self._all_stats[self._all_stats.index(previous)] = stats
         
         return stats
     
@@ -97,23 +121,26 @@ class PerformanceTracker:
         Returns:
             Estimated token count
         """
-        content = ""
+        total_chars = 0
         
-        # Try to extract text content from different response formats
+        # Try to measure text content from different response formats;
+        # only the length matters, so segments are never joined
         if 'content' in response_data:
             if isinstance(response_data['content'], list):
-                content = " ".join([item.get('text', '') for item in response_data['content']])
+                items = response_data['content']
+                # Include the single-space separators a join would add
+                total_chars = sum(len(item.get('text', '')) for item in items) + max(0, len(items) - 1)
             else:
-                content = str(response_data['content'])
+                total_chars = len(str(response_data['content']))
         elif 'choices' in response_data:
             choices = response_data['choices']
             if isinstance(choices, list) and choices:
                 choice = choices[0]
                 if 'message' in choice and 'content' in choice['message']:
-                    content = choice['message']['content']
+                    total_chars = len(choice['message']['content'])
         
         # Rough token estimation (4 chars ≈ 1 token)
-        return max(1, len(content) // 4)
+        return max(1, total_chars // 4)
     
     def get_individual_stats(self, folder_name: str) -> Optional[ModelCallStats]:
         """
@@ -143,9 +170,9 @@ class PerformanceTracker:
         Returns:
             Dictionary with session-wide statistics
         """
-        all_stats = list(self.individual_calls.values()) + list(self.analysis_calls.values())
+        total_calls = len(self._all_stats)
         
-        if not all_stats:
+        if not total_calls:
             return {
                 'total_calls': 0,
                 'total_tokens': 0,
@@ -154,22 +181,33 @@ class PerformanceTracker:
                 'session_duration_seconds': time.time() - self.session_start
             }
         
-        total_calls = len(all_stats)
-        total_tokens = sum(stat.tokens_used for stat in all_stats)
-        total_latency_ms = sum(stat.latency_ms for stat in all_stats)
-        average_latency_ms = total_latency_ms / total_calls if total_calls > 0 else 0.0
+        # Single pass over every recorded call
+        total_tokens = total_input_tokens = total_output_tokens = 0
+        total_latency_ms = 0.0
+        min_latency_ms = float('inf')
+        max_latency_ms = 0.0
+        for stat in self._all_stats:
+            latency_ms = stat.latency_ms
+            total_tokens += stat.tokens_used
+            total_input_tokens += stat.input_tokens
+            total_output_tokens += stat.output_tokens
+            total_latency_ms += latency_ms
+            if latency_ms < min_latency_ms:
+                min_latency_ms = latency_ms
+            if latency_ms > max_latency_ms:
+                max_latency_ms = latency_ms
         
         return {
             'total_calls': total_calls,
             'individual_calls': len(self.individual_calls),
             'analysis_calls': len(self.analysis_calls),
             'total_tokens': total_tokens,
-            'total_input_tokens': sum(stat.input_tokens for stat in all_stats),
-            'total_output_tokens': sum(stat.output_tokens for stat in all_stats),
+            'total_input_tokens': total_input_tokens,
+            'total_output_tokens': total_output_tokens,
             'total_latency_ms': total_latency_ms,
-            'average_latency_ms': average_latency_ms,
-            'min_latency_ms': min(stat.latency_ms for stat in all_stats),
-            'max_latency_ms': max(stat.latency_ms for stat in all_stats),
+            'average_latency_ms': total_latency_ms / total_calls,
+            'min_latency_ms': min_latency_ms,
+            'max_latency_ms': max_latency_ms,
             'session_duration_seconds': time.time() - self.session_start
         }
     
@@ -1,41 +1,136 @@
 """Report generation module for creating comprehensive meeting reports in multiple formats."""
 
+import os
 import re
+import asyncio
+import shutil
 import subprocess
+import tempfile
+from functools import lru_cache, partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import BinaryIO, List, Dict, Iterable, Iterator, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 
-# Check for markdown to PDF converters
-MARKDOWN_TO_PDF_AVAILABLE = False
-CONVERTER_COMMAND = None
-
-# Try different markdown to PDF converters in order of preference
-CONVERTERS = [
-    ('pandoc', ['pandoc', '--version']),
-    ('weasyprint', ['weasyprint', '--version']),
-    ('wkhtmltopdf', ['wkhtmltopdf', '--version'])
-]
-
-for converter, test_cmd in CONVERTERS:
-    try:
-        subprocess.run(test_cmd, capture_output=True, check=True)
-        CONVERTER_COMMAND = converter
-        MARKDOWN_TO_PDF_AVAILABLE = True
-        break
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        continue
+# Markdown to PDF converters in order of preference
+CONVERTERS = ('pandoc', 'weasyprint', 'wkhtmltopdf')
+
+# Headings that mark the start of the summary body in generated summary files
+SUMMARY_SECTION_HEADINGS = ('## Summary', '## Analysis')
+
+# Metadata lines dropped from individual summaries in the consolidated report
+METADATA_LINE_PREFIXES = (
+    '**Date Generated**',
+    '**Duration**',
+    '**Transcript Words**',
+    '**Source File**',
+    '## Meeting Information'
+)
+
+# Line prefixes that mark headings, emphasis or list items rather than prose
+NON_PROSE_PREFIXES = ('#', '**', '-')
+
+# Markers opening and closing fenced code blocks
+CODE_FENCES = ('```', '~~~')
+
+# Indentation that makes a line part of an indented code block
+CODE_INDENTS = ('    ', '\t')
+
+# Precompiled patterns for cleaning folder names and summary lines
+# Dates like 20250815, 2025-08-15, 15-08-2025 and 8/15/2025
+# (longest alternatives first so a bare digit run never wins over a full date)
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}-\d{2}-\d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{8}')
+# Runs of dashes, underscores and whitespace
+SEPARATOR_RUN_PATTERN = re.compile(r'[-_\s]+')
+# Trailing "Meeting Summary" suffix on summary titles, with optional dash
+MEETING_SUFFIX_PATTERN = re.compile(r'\s*-?\s*Meeting Summary$')
+
+# Runs of hyphens to collapse in heading anchors
+HYPHEN_RUN_PATTERN = re.compile(r'-+')
+
+# Translation table deleting inline markdown emphasis characters
+MARKDOWN_CHARS_TABLE = str.maketrans('', '', '*_`')
+
+# Maximum number of threads used to prefetch chapter summaries
+MAX_PREFETCH_WORKERS = 8
+
+# Fixed pieces of the consolidated report, pre-encoded
+BLANK_LINE = b'\n'
+SECTION_BREAK = b'\n---\n\n'
+TOC_HEADING = b'## Table of Contents\n\n'
+GLOBAL_SUMMARY_HEADING = b'# Global Summary\n\n'
+
+# Leading bytes of the image formats the PDF converters can embed (PNG, JPEG, GIF)
+VALID_IMAGE_HEADERS = (b'\x89PNG', b'\xff\xd8\xff', b'GIF8')
+
+# Screenshot section written by FileWriter: one "### Screenshot N" block per image
+SCREENSHOT_SECTION_HEADING = '## Meeting Screenshots'
+SCREENSHOT_HEADING_PREFIX = '### Screenshot '
 
 from .config import Config
 from .utils import (
     safe_read_file, 
-    safe_write_file,
     setup_module_logger,
-    get_iso_timestamp,
-    ProcessingTimer
+    ProcessingTimer,
+    WRITE_BUFFER_SIZE
 )
 
 
+@lru_cache(maxsize=1)
+def _detect_converter() -> Optional[str]:
+    """
+    Find the preferred markdown to PDF converter on PATH.
+    
+    Resolved on first use with a PATH lookup rather than spawning each
+    converter, so importing this module stays cheap.
+    
+    Returns:
+        Converter command name, or None if none is installed
+    """
+    for converter in CONVERTERS:
+        if shutil.which(converter):
+            return converter
+    return None
+
+
+class _SlugTranslation(dict):
+    """
+    str.translate table for heading anchors.
+    
+    Keeps lowercase ASCII letters, digits and hyphens, turns whitespace into
+    hyphens and deletes everything else. Characters are resolved on first
+    sight and remembered, so the table covers any input without enumerating
+    the whole Unicode range up front.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char in 'abcdefghijklmnopqrstuvwxyz0123456789-':
+            value = char
+        elif char.isspace():
+            value = '-'
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+SLUG_TRANSLATION = _SlugTranslation()
+
+
+@dataclass
+class ChapterMeta:
+    """Per-chapter metadata resolved once before the report is assembled."""
+    topic: str
+    date: Optional[str]
+    duration: Optional[str]
+    participants: Tuple[str, ...]
+    summary_path: Path
+    folder_name: str
+
+
 class ReportGenerator:
     """Generates comprehensive reports in multiple formats from meeting summaries."""
     
@@ -48,14 +143,8 @@ class ReportGenerator:
         """
         self.config = config
         self.logger = setup_module_logger(__name__)
-        
-        if not MARKDOWN_TO_PDF_AVAILABLE:
-            self.logger.warning(
-                f"No markdown to PDF converter found. Install one of: {[c[0] for c in CONVERTERS]}. "
-                "PDF generation will create consolidated markdown only."
-            )
-        else:
-            self.logger.info(f"Report Generator initialized using {CONVERTER_COMMAND}")
+        # Image validity keyed by (path, mtime_ns), shared across chapters
+        self._image_check_cache: Dict[Tuple[str, int], bool] = {}
     
     def generate_comprehensive_pdf(
         self, 
@@ -82,8 +171,12 @@ class ReportGenerator:
                 "message": "PDF generation is disabled in configuration"
             }
         
+        # Capture the clock once so every result and filename agree
+        now = datetime.now()
+        ts = now.isoformat()
+        
         # Format filenames
-        pdf_filename = self._format_filename(self.config.pdf_filename)
+        pdf_filename = self._format_filename(self.config.pdf_filename, now)
         pdf_path = summaries_path / pdf_filename
         markdown_filename = pdf_filename.replace('.pdf', '_consolidated.md')
         markdown_path = summaries_path / markdown_filename
@@ -95,7 +188,7 @@ class ReportGenerator:
                 "status": "skipped",
                 "message": "PDF report already exists",
                 "pdf_path": str(pdf_path),
-                "timestamp": get_iso_timestamp()
+                "timestamp": ts
             }
         
         try:
@@ -104,36 +197,60 @@ class ReportGenerator:
             with ProcessingTimer("PDF generation") as timer:
                 # Sort individual summaries chronologically
                 sorted_summaries = self._sort_summaries_chronologically(individual_summaries)
+                chapters = [self._to_meta(summary) for summary in sorted_summaries]
                 
-                # Step 1: Create consolidated markdown file
-                self.logger.info("Creating consolidated markdown file...")
-                self._create_consolidated_markdown(
-                    markdown_path,
-                    global_summary_path,
-                    sorted_summaries,
-                    summaries_path
-                )
+                converter = _detect_converter()
+                keep_markdown = self.config.pdf_keep_markdown or converter != 'pandoc'
+                
+                if keep_markdown:
+                    # Step 1: Create consolidated markdown file
+                    self.logger.info("Creating consolidated markdown file...")
+                    self._create_consolidated_markdown(
+                        markdown_path,
+                        global_summary_path,
+                        chapters,
+                        summaries_path,
+                        now
+                    )
                 
                 # Step 2: Convert markdown to PDF
-                if MARKDOWN_TO_PDF_AVAILABLE:
-                    self.logger.info(f"Converting markdown to PDF using {CONVERTER_COMMAND}...")
+                if not keep_markdown:
+                    self.logger.info("Streaming consolidated markdown to pandoc...")
+                    success = self._stream_markdown_to_pdf(
+                        pdf_path,
+                        global_summary_path,
+                        chapters,
+                        summaries_path,
+                        now
+                    )
+                    if not success:
+                        return {
+                            "status": "error",
+                            "error": "Markdown to PDF conversion failed",
+                            "timestamp": ts
+                        }
+                elif converter:
+                    self.logger.info(f"Converting markdown to PDF using {converter}...")
                     success = self._convert_markdown_to_pdf(markdown_path, pdf_path)
                     if not success:
                         return {
                             "status": "error",
                             "error": "Markdown to PDF conversion failed",
                             "consolidated_markdown": str(markdown_path),
-                            "timestamp": get_iso_timestamp()
+                            "timestamp": ts
                         }
                 else:
-                    self.logger.info("No PDF converter available, created consolidated markdown only")
+                    self.logger.warning(
+                        f"No markdown to PDF converter found. Install one of: {list(CONVERTERS)}. "
+                        "Created consolidated markdown only."
+                    )
                     return {
                         "status": "markdown_only",
                         "message": "Created consolidated markdown file (no PDF converter available)",
                         "consolidated_markdown": str(markdown_path),
                         "summaries_included": len(sorted_summaries),
                         "generation_time": timer.duration_rounded,
-                        "timestamp": get_iso_timestamp()
+                        "timestamp": ts
                     }
             
             self.logger.info(f"PDF generation completed in {timer.duration_rounded}s")
@@ -141,11 +258,11 @@ class ReportGenerator:
             return {
                 "status": "success",
                 "pdf_path": str(pdf_path),
-                "consolidated_markdown": str(markdown_path),
+                "consolidated_markdown": str(markdown_path) if keep_markdown else None,
                 "pdf_filename": pdf_filename,
                 "generation_time": timer.duration_rounded,
                 "summaries_included": len(sorted_summaries),
-                "timestamp": get_iso_timestamp()
+                "timestamp": ts
             }
             
         except Exception as e:
@@ -153,34 +270,78 @@ class ReportGenerator:
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": get_iso_timestamp()
+                "timestamp": ts
             }
     
-    def _format_filename(self, template: str) -> str:
+    async def agenerate_comprehensive_pdf(
+        self, 
+        summaries_path: Path, 
+        global_summary_path: Path,
+        individual_summaries: List[Dict],
+        force_overwrite: bool = False
+    ) -> Dict[str, any]:
+        """
+        Generate comprehensive PDF report without blocking the event loop.
+        
+        The report is assembled and converted in the default executor, so
+        other tasks keep running while the converter works.
+        
+        Args:
+            summaries_path: Path to summaries directory
+            global_summary_path: Path to global summary file
+            individual_summaries: List of individual summary metadata
+            force_overwrite: Whether to overwrite existing PDF
+            
+        Returns:
+            Dictionary with generation results
+        """
+        # asyncio.to_thread needs Python 3.9, so go through the executor directly
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.generate_comprehensive_pdf,
+                summaries_path,
+                global_summary_path,
+                individual_summaries,
+                force_overwrite
+            )
+        )
+    
+    def _format_filename(self, template: str, now: Optional[datetime] = None) -> str:
         """Format PDF filename template with variables."""
+        if now is None:
+            now = datetime.now()
         format_vars = {
-            'timestamp': get_iso_timestamp().replace(':', '-').replace('T', '_'),
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'timestamp': now.isoformat().replace(':', '-').replace('T', '_'),
+            'date': now.strftime('%Y-%m-%d'),
         }
         return template.format(**format_vars)
     
     def _sort_summaries_chronologically(self, summaries: List[Dict]) -> List[Dict]:
         """Sort summaries by date, with fallback to folder name."""
-        def sort_key(summary):
-            # Try to use meeting_date first
-            if summary.get('meeting_date'):
-                return summary['meeting_date']
-            # Fall back to folder name which often contains dates
-            return summary.get('folder_name', 'z')
-        
-        return sorted(summaries, key=sort_key)
+        # Use meeting_date first, falling back to folder name which often contains dates
+        return sorted(summaries, key=lambda s: s.get('meeting_date') or s.get('folder_name', 'z'))
+    
+    def _to_meta(self, summary: Dict) -> ChapterMeta:
+        """Resolve the chapter metadata used by the report from a summary dict."""
+        # Only metadata is kept; chapter bodies are read as they are written
+        return ChapterMeta(
+            topic=self._extract_meeting_topic(summary),
+            date=summary.get('meeting_date'),
+            duration=summary.get('duration'),
+            participants=tuple(summary.get('participants') or ()),
+            summary_path=Path(summary['summary_path']),
+            folder_name=summary.get('folder_name', '')
+        )
     
     def _create_consolidated_markdown(
         self,
         markdown_path: Path,
         global_summary_path: Path,
-        sorted_summaries: List[Dict],
-        summaries_path: Path
+        chapters: List[ChapterMeta],
+        summaries_path: Path,
+        now: Optional[datetime] = None
     ) -> None:
         """
         Create a consolidated markdown file with all summaries.
@@ -188,91 +349,290 @@ class ReportGenerator:
         Args:
             markdown_path: Path where to save consolidated markdown
             global_summary_path: Path to global summary file
-            sorted_summaries: List of individual summaries sorted chronologically
+            chapters: Chapter metadata for individual summaries, sorted chronologically
             summaries_path: Path to summaries directory
+            now: Report generation time, defaults to the current time
         """
-        content_parts = []
+        # Stream the report straight to disk; a large buffer keeps the many
+        # small section writes from each becoming a system call
+        with open(markdown_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            self._write_consolidated_markdown(f, global_summary_path, chapters, summaries_path, now)
+        
+        self.logger.info(f"Created consolidated markdown file: {markdown_path}")
+    
+    def _write_consolidated_markdown(
+        self,
+        output: BinaryIO,
+        global_summary_path: Path,
+        chapters: List[ChapterMeta],
+        summaries_path: Path,
+        now: Optional[datetime] = None
+    ) -> None:
+        """
+        Write the consolidated markdown for all summaries to a binary stream.
+        
+        Args:
+            output: Binary stream receiving UTF-8 encoded markdown
+            global_summary_path: Path to global summary file
+            chapters: Chapter metadata for individual summaries, sorted chronologically
+            summaries_path: Path to summaries directory
+            now: Report generation time, defaults to the current time
+        """
+        if now is None:
+            now = datetime.now()
+        
+        write = output.write
+        
+        def emit(text: str) -> None:
+            write(text.encode('utf-8'))
+            write(BLANK_LINE)
         
         # Document title and metadata
-        content_parts.append(f"# {self.config.pdf_title}")
-        content_parts.append("")
-        content_parts.append(f"**Report Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
-        content_parts.append(f"**Total Meetings:** {len(sorted_summaries)}")
-        content_parts.append(f"**Date Range:** {self._get_date_range(sorted_summaries)}")
-        content_parts.append("")
+        emit(f"# {self.config.pdf_title}")
+        write(BLANK_LINE)
+        emit(f"**Report Generated:** {now.strftime('%B %d, %Y at %I:%M %p')}")
+        emit(f"**Total Meetings:** {len(chapters)}")
+        emit(f"**Date Range:** {self._get_date_range(chapters)}")
+        write(BLANK_LINE)
         
         # Table of contents
         if self.config.pdf_include_table_of_contents:
-            content_parts.append("## Table of Contents")
-            content_parts.append("")
+            write(TOC_HEADING)
             global_summary_slug = self._generate_markdown_slug("Global Summary")
-            content_parts.append(f"1. [Global Summary](#{global_summary_slug})")
-            for i, summary in enumerate(sorted_summaries, 1):
-                topic = self._extract_meeting_topic(summary)
+            emit(f"1. [Global Summary](#{global_summary_slug})")
+            for i, chapter in enumerate(chapters, 1):
+                topic = chapter.topic
                 # Generate slug that matches the actual chapter heading "Chapter X: Topic"
                 chapter_title = f"Chapter {i}: {topic}"
                 safe_slug = self._generate_markdown_slug(chapter_title)
                 # Use i+1 for TOC numbering since Global Summary takes position 1
-                content_parts.append(f"{i+1}. [{topic}](#{safe_slug})")
-            content_parts.append("")
-            content_parts.append("---")
-            content_parts.append("")
+                emit(f"{i+1}. [{topic}](#{safe_slug})")
+            write(SECTION_BREAK)
         
         # Global summary section
-        content_parts.append("# Global Summary")
-        content_parts.append("")
+        write(GLOBAL_SUMMARY_HEADING)
         
         if global_summary_path.exists():
             global_content = safe_read_file(global_summary_path)
             # Remove the title from global content as we have our own
-            cleaned_global = self._clean_summary_content(global_content, remove_title=True)
-            content_parts.append(cleaned_global)
+            cleaned_global = self._clean_summary_content(
+                global_content, remove_title=True, base_path=summaries_path
+            )
+            emit(cleaned_global)
         else:
-            content_parts.append("Global summary not available.")
+            emit("Global summary not available.")
         
-        content_parts.append("")
-        content_parts.append("---")
-        content_parts.append("")
+        write(SECTION_BREAK)
         
         # Individual summary sections
-        for i, summary in enumerate(sorted_summaries, 1):
-            topic = self._extract_meeting_topic(summary)
-            content_parts.append(f"# Chapter {i}: {topic}")
-            content_parts.append("")
+        contents = self._iter_chapter_contents(chapters, summaries_path)
+        for (i, chapter), content in zip(enumerate(chapters, 1), contents):
+            emit(f"# Chapter {i}: {chapter.topic}")
+            write(BLANK_LINE)
             
             # Add meeting metadata
-            if summary.get('meeting_date'):
-                content_parts.append(f"**Date:** {summary['meeting_date']}")
-            if summary.get('duration'):
-                content_parts.append(f"**Duration:** {summary['duration']}")
-            if summary.get('participants'):
-                participants = ', '.join(summary['participants'][:5])
-                if len(summary['participants']) > 5:
-                    participants += f" and {len(summary['participants']) - 5} others"
-                content_parts.append(f"**Participants:** {participants}")
-            
-            if any([summary.get('meeting_date'), summary.get('duration'), summary.get('participants')]):
-                content_parts.append("")
+            if chapter.date:
+                emit(f"**Date:** {chapter.date}")
+            if chapter.duration:
+                emit(f"**Duration:** {chapter.duration}")
+            if chapter.participants:
+                participants = ', '.join(chapter.participants[:5])
+                if len(chapter.participants) > 5:
+                    participants += f" and {len(chapter.participants) - 5} others"
+                emit(f"**Participants:** {participants}")
+            
+            if chapter.date or chapter.duration or chapter.participants:
+                write(BLANK_LINE)
             
             # Add summary content
-            summary_path = Path(summary['summary_path'])
-            if summary_path.exists():
-                summary_content = safe_read_file(summary_path)
-                cleaned_content = self._clean_summary_content(summary_content)
-                content_parts.append(cleaned_content)
+            if content is not None:
+                write(content)
+                write(BLANK_LINE)
             else:
-                content_parts.append("Summary content not available.")
+                emit("Summary content not available.")
             
-            content_parts.append("")
-            if i < len(sorted_summaries):  # Don't add separator after last chapter
-                content_parts.append("---")
-                content_parts.append("")
+            if i < len(chapters):  # Don't add separator after last chapter
+                write(SECTION_BREAK)
+    
+    def _scan_summaries(self, summaries_path: Path) -> Dict[str, os.DirEntry]:
+        """
+        List the files in the summaries directory.
         
-        # Write consolidated markdown
-        consolidated_content = "\n".join(content_parts)
-        safe_write_file(markdown_path, consolidated_content)
+        Args:
+            summaries_path: Path to summaries directory
+            
+        Returns:
+            Directory entries keyed by filename
+        """
+        try:
+            with os.scandir(summaries_path) as it:
+                return {entry.name: entry for entry in it if entry.is_file()}
+        except OSError:
+            return {}
+    
+    def _iter_chapter_contents(
+        self,
+        chapters: List[ChapterMeta],
+        summaries_path: Path
+    ) -> Iterator[Optional[bytes]]:
+        """
+        Load chapter contents in order, reading a few chapters ahead.
         
-        self.logger.info(f"Created consolidated markdown file: {markdown_path}")
+        File I/O for the next chapters overlaps with writing the current one,
+        while at most MAX_PREFETCH_WORKERS cleaned chapters are held at a time.
+        
+        Args:
+            chapters: Chapter metadata, in report order
+            summaries_path: Path to summaries directory
+            
+        Yields:
+            Cleaned content of each chapter, as from _load_chapter_content
+        """
+        if not chapters:
+            return
+        
+        # One directory listing answers "does it exist" for every chapter
+        # kept in the summaries directory
+        entries = self._scan_summaries(summaries_path)
+        window = min(MAX_PREFETCH_WORKERS, len(chapters))
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pending = deque(
+                executor.submit(self._load_chapter_content, chapter, summaries_path, entries)
+                for chapter in chapters[:window]
+            )
+            for chapter in chapters[window:]:
+                yield pending.popleft().result()
+                pending.append(executor.submit(self._load_chapter_content, chapter, summaries_path, entries))
+            while pending:
+                yield pending.popleft().result()
+    
+    def _load_chapter_content(
+        self,
+        chapter: ChapterMeta,
+        summaries_path: Path,
+        entries: Optional[Dict[str, os.DirEntry]] = None
+    ) -> Optional[bytes]:
+        """
+        Read and clean a chapter's summary file.
+        
+        The result is returned already encoded, so encoding happens in the
+        prefetch workers along with the cleaning.
+        
+        Args:
+            chapter: Chapter to load
+            summaries_path: Path to summaries directory
+            entries: Directory entries of summaries_path from _scan_summaries
+            
+        Returns:
+            Cleaned summary content as UTF-8 bytes, or None if the file does not exist
+        """
+        if entries is not None and chapter.summary_path.parent == summaries_path:
+            if chapter.summary_path.name not in entries:
+                return None
+        elif not chapter.summary_path.exists():
+            return None
+        
+        content = safe_read_file(chapter.summary_path)
+        return self._clean_summary_content(content, base_path=summaries_path).encode('utf-8')
+    
+    def _pandoc_command(self, pdf_filename: str, markdown_filename: Optional[str] = None) -> List[str]:
+        """
+        Build the pandoc command line.
+        
+        Args:
+            pdf_filename: PDF filename, relative to the summaries directory
+            markdown_filename: Markdown filename, or None to read from stdin
+            
+        Returns:
+            Command arguments
+        """
+        # Pandoc with good PDF options
+        cmd = ['pandoc', '--from=markdown']
+        if markdown_filename:
+            cmd.append(markdown_filename)
+        cmd.extend([
+            '-o', pdf_filename,
+            '--pdf-engine=xelatex',
+            '--variable', 'geometry:margin=1in',
+            '--variable', 'fontsize=11pt',
+            '--variable', 'documentclass=article',
+            '--variable', 'linestretch=1.2',
+        ])
+        
+        # Add TOC if enabled
+        if self.config.pdf_include_table_of_contents:
+            cmd.append('--table-of-contents')
+        
+        cmd.extend(['--highlight-style=tango'])
+        return cmd
+    
+    def _stream_markdown_to_pdf(
+        self,
+        pdf_path: Path,
+        global_summary_path: Path,
+        chapters: List[ChapterMeta],
+        summaries_path: Path,
+        now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Convert the consolidated report to PDF by piping it into pandoc.
+        
+        The markdown never touches the disk, which saves writing it out and
+        having pandoc read it back for large reports.
+        
+        Args:
+            pdf_path: Path where to save PDF
+            global_summary_path: Path to global summary file
+            chapters: Chapter metadata for individual summaries, sorted chronologically
+            summaries_path: Path to summaries directory
+            now: Report generation time, defaults to the current time
+            
+        Returns:
+            True if conversion successful, False otherwise
+        """
+        cmd = self._pandoc_command(pdf_path.name)
+        self.logger.info(f"Running command: {' '.join(cmd)}")
+        
+        try:
+            # pandoc's diagnostics go to a temporary file rather than a pipe, so
+            # a chatty pandoc cannot block while we are still feeding stdin
+            with tempfile.TemporaryFile() as stderr_file:
+                # Run from the summaries directory so relative image paths work
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                    cwd=summaries_path,
+                    bufsize=WRITE_BUFFER_SIZE
+                )
+                broken_pipe = False
+                try:
+                    try:
+                        self._write_consolidated_markdown(
+                            process.stdin, global_summary_path, chapters, summaries_path, now
+                        )
+                    finally:
+                        process.stdin.close()
+                except BrokenPipeError:
+                    # pandoc exited before reading all of its input (bad option,
+                    # missing LaTeX engine); its stderr says why
+                    broken_pipe = True
+                finally:
+                    returncode = process.wait()
+                
+                if returncode != 0 or broken_pipe:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode('utf-8', 'replace')
+                    self.logger.error(f"PDF conversion failed: {stderr or 'pandoc stopped reading its input'}")
+                    return False
+            
+            self.logger.info(f"Successfully converted markdown to PDF: {pdf_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error during PDF conversion: {str(e)}")
+            return False
     
     def _convert_markdown_to_pdf(self, markdown_path: Path, pdf_path: Path) -> bool:
         """
@@ -285,35 +645,17 @@ class ReportGenerator:
         Returns:
             True if conversion successful, False otherwise
         """
+        converter = _detect_converter()
         try:
-            if CONVERTER_COMMAND == 'pandoc':
-                # Pandoc with good PDF options
+            if converter == 'pandoc':
                 # Use relative paths since we're running from the markdown directory
-                markdown_filename = markdown_path.name
-                pdf_filename = pdf_path.name
-                cmd = [
-                    'pandoc',
-                    '--from=markdown',
-                    markdown_filename,
-                    '-o', pdf_filename,
-                    '--pdf-engine=xelatex',
-                    '--variable', 'geometry:margin=1in',
-                    '--variable', 'fontsize=11pt',
-                    '--variable', 'documentclass=article',
-                    '--variable', 'linestretch=1.2',
-                ]
-                
-                # Add TOC if enabled
-                if self.config.pdf_include_table_of_contents:
-                    cmd.append('--table-of-contents')
-                
-                cmd.extend(['--highlight-style=tango'])
+                cmd = self._pandoc_command(pdf_path.name, markdown_path.name)
                 
-            elif CONVERTER_COMMAND == 'weasyprint':
+            elif converter == 'weasyprint':
                 # WeasyPrint
                 cmd = ['weasyprint', str(markdown_path), str(pdf_path)]
                 
-            elif CONVERTER_COMMAND == 'wkhtmltopdf':
+            elif converter == 'wkhtmltopdf':
                 # wkhtmltopdf
                 cmd = [
                     'wkhtmltopdf',
@@ -326,81 +668,270 @@ class ReportGenerator:
                     str(pdf_path)
                 ]
             else:
-                self.logger.error(f"Unknown converter: {CONVERTER_COMMAND}")
+                self.logger.error(f"Unknown converter: {converter}")
                 return False
             
             self.logger.info(f"Running command: {' '.join(cmd)}")
-            # Run pandoc from the directory containing the markdown file so relative image paths work
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=markdown_path.parent)
+            # Run pandoc from the directory containing the markdown file so relative image paths work.
+            # check=True makes the exit status authoritative; only stderr is kept, for diagnostics
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+                cwd=markdown_path.parent
+            )
+            
+            self.logger.info(f"Successfully converted markdown to PDF: {pdf_path}")
+            return True
             
-            if pdf_path.exists():
-                self.logger.info(f"Successfully converted markdown to PDF: {pdf_path}")
-                return True
-            else:
-                self.logger.error("PDF conversion completed but file not found")
-                return False
-                
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"PDF conversion failed: {e.stderr}")
+            stderr = e.stderr.decode('utf-8', 'replace') if e.stderr else ''
+            self.logger.error(f"PDF conversion failed: {stderr}")
             return False
         except Exception as e:
             self.logger.error(f"Error during PDF conversion: {str(e)}")
             return False
     
-    def _clean_summary_content(self, content: str, remove_title: bool = False) -> str:
+    def _clean_summary_content(
+        self,
+        content: str,
+        remove_title: bool = False,
+        base_path: Optional[Path] = None
+    ) -> str:
         """
         Clean summary content for consolidation.
         
         Args:
             content: Original summary content
             remove_title: Whether to remove the title line
+            base_path: Directory image references are relative to; when given,
+                references to missing or unreadable images are dropped
             
         Returns:
             Cleaned content
         """
+        skip_until_summary = remove_title
+
+        if remove_title:
+            # Jump straight to the summary section when its heading is present,
+            # falling back to the line-by-line heuristic below otherwise
+            section_start = self._find_summary_section(content)
+            if section_start >= 0:
+                content = content[section_start:]
+                skip_until_summary = False
+
         lines = content.split('\n')
-        cleaned_lines = []
+        if base_path is not None:
+            lines = self._drop_broken_screenshots(lines, base_path)
         
-        skip_until_summary = remove_title
+        cleaned_lines = self._iter_cleaned_lines(lines, skip_until_summary, base_path)
+        return '\n'.join(cleaned_lines).strip()
+    
+    def _iter_cleaned_lines(
+        self,
+        lines: Iterable[str],
+        skip_until_summary: bool = False,
+        base_path: Optional[Path] = None
+    ) -> Iterator[str]:
+        """
+        Clean summary lines one at a time.
         
-        for i, line in enumerate(lines):
+        Args:
+            lines: Summary lines without line terminators
+            skip_until_summary: Whether to drop lines until the summary body starts
+            base_path: Directory image references are relative to; when given,
+                references to missing or unreadable images are dropped
+            
+        Yields:
+            Cleaned lines
+        """
+        open_fence = None  # Marker of the fenced code block being passed through
+        last_blank = False
+        last_indented = False  # Whether the last non-blank line was indented code
+        after_bold_header = False
+
+        for line in lines:
+            # Strip once per line; the original line is what gets emitted
+            stripped = line.strip()
+            
+            # Add blank line after bold headers if the next line is a bullet point
+            # This ensures proper markdown list formatting for pandoc
+            if after_bold_header:
+                after_bold_header = False
+                if stripped.startswith('-'):
+                    yield ''
+                    last_blank = True
+            
             # Skip title and meeting info if requested
             if skip_until_summary:
-                if line.strip().startswith('## Summary') or line.strip().startswith('## Analysis'):
+                if stripped.startswith(SUMMARY_SECTION_HEADINGS):
                     skip_until_summary = False
-                    cleaned_lines.append(line)
-                elif line.strip() and not line.startswith('#') and not line.startswith('**') and not line.startswith('-'):
+                    yield line
+                elif stripped and not line.startswith(NON_PROSE_PREFIXES):
                     # Found content, include it
                     skip_until_summary = False
-                    cleaned_lines.append(line)
+                    yield line
                 continue
             
             # Skip metadata lines at the start
-            if (line.startswith('**Date Generated**') or
-                line.startswith('**Duration**') or
-                line.startswith('**Transcript Words**') or
-                line.startswith('**Source File**') or
-                line.startswith('## Meeting Information')):
+            if line.startswith(METADATA_LINE_PREFIXES):
                 continue
-            
+
+            # Collapse runs of blank lines outside code blocks, since markdown
+            # treats them as a single paragraph break anyway; inside fenced or
+            # indented code they are part of the code
+            if stripped.startswith(CODE_FENCES):
+                if open_fence is None:
+                    open_fence = stripped[:3]
+                elif stripped.startswith(open_fence):
+                    open_fence = None
+            elif not stripped and open_fence is None and last_blank and not last_indented:
+                continue
+
             # Fix image paths - convert relative paths to absolute paths
-            if line.strip().startswith('![') and '](images/' in line:
+            if '](images/' in line and stripped.startswith('!['):
+                if base_path is not None and not self._has_valid_image(stripped, base_path):
+                    continue
                 # Replace images/ with ./images/ to make it relative to the markdown file location
                 line = line.replace('](images/', '](./images/')
             
-            cleaned_lines.append(line)
+            yield line
+            last_blank = not stripped
+            if stripped:
+                last_indented = line.startswith(CODE_INDENTS)
+            after_bold_header = stripped.startswith('**') and stripped.endswith(':**')
+
+    def _drop_broken_screenshots(self, lines: List[str], base_path: Path) -> List[str]:
+        """
+        Remove screenshot blocks whose image can't be embedded.
+        
+        A block runs from its "### Screenshot N" heading up to the next heading,
+        so its timestamp and context text go together with the image. A
+        screenshots section left without any screenshot is removed as well.
+        
+        Args:
+            lines: Summary lines without line terminators
+            base_path: Directory image references are relative to
             
-            # Add blank line after bold headers if the next line is a bullet point
-            # This ensures proper markdown list formatting for pandoc
-            if (line.strip().startswith('**') and line.strip().endswith(':**') and 
-                i + 1 < len(lines) and lines[i + 1].strip().startswith('-')):
-                cleaned_lines.append('')  # Add blank line
+        Returns:
+            Lines with broken screenshot blocks removed
+        """
+        if not any(line.startswith(SCREENSHOT_HEADING_PREFIX) for line in lines):
+            return lines
         
-        return '\n'.join(cleaned_lines).strip()
+        kept_lines = []
+        section_start = None  # Index in kept_lines of the open screenshots section
+        section_kept = section_dropped = 0
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            if line.startswith(SCREENSHOT_HEADING_PREFIX):
+                end = i + 1
+                while end < len(lines) and not lines[end].startswith('#'):
+                    end += 1
+                block = lines[i:end]
+                if all(self._has_valid_image(block_line.strip(), base_path) for block_line in block
+                       if '](images/' in block_line and block_line.strip().startswith('![')):
+                    kept_lines.extend(block)
+                    section_kept += 1
+                else:
+                    section_dropped += 1
+                i = end
+                continue
+            
+            if line.startswith('#'):
+                # Any other heading closes the screenshots section
+                if section_start is not None and section_dropped and not section_kept:
+                    del kept_lines[section_start:]
+                section_start = None
+                if line.startswith(SCREENSHOT_SECTION_HEADING):
+                    section_start = len(kept_lines)
+                    section_kept = section_dropped = 0
+            
+            kept_lines.append(line)
+            i += 1
+        
+        if section_start is not None and section_dropped and not section_kept:
+            del kept_lines[section_start:]
+        return kept_lines
+    
+    def _has_valid_image(self, image_line: str, base_path: Path) -> bool:
+        """
+        Check the image referenced by a stripped "![...](images/...)" line.
+        
+        Args:
+            image_line: Stripped markdown image line
+            base_path: Directory the image reference is relative to
+            
+        Returns:
+            True if the image can be embedded, False otherwise (with a warning logged)
+        """
+        image_ref = self._image_ref(image_line)
+        if self._is_valid_image(base_path / image_ref):
+            return True
+        self.logger.warning(f"Skipping missing or invalid image: {image_ref}")
+        return False
+    
+    @staticmethod
+    def _image_ref(image_line: str) -> str:
+        """Get the target of a stripped "![...](...)" markdown image line."""
+        return image_line[image_line.index('](') + 2:image_line.rfind(')')]
+    
+    def _is_valid_image(self, image_path: Path) -> bool:
+        """
+        Check that an image exists and starts with a known image header.
+        
+        The converters abort or emit broken pages on corrupt images, so a few
+        header bytes are sniffed up front instead. Results are cached by
+        modification time since keyframes are shared between summaries.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            True if the image can be embedded, False otherwise
+        """
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return False
+        
+        key = (str(image_path), stat.st_mtime_ns)
+        valid = self._image_check_cache.get(key)
+        if valid is None:
+            try:
+                with open(image_path, 'rb') as f:
+                    header = f.read(4)
+            except OSError:
+                header = b''
+            valid = header.startswith(VALID_IMAGE_HEADERS)
+            self._image_check_cache[key] = valid
+        return valid
     
-    def _get_date_range(self, summaries: List[Dict]) -> str:
-        """Get date range string for summaries."""
-        dates = [s.get('meeting_date') for s in summaries if s.get('meeting_date')]
+    def _find_summary_section(self, content: str) -> int:
+        """
+        Find the offset of the first summary section heading.
+
+        Args:
+            content: Summary content
+
+        Returns:
+            Offset of the heading line, or -1 if no heading is found
+        """
+        offsets = []
+        for heading in SUMMARY_SECTION_HEADINGS:
+            if content.startswith(heading):
+                return 0
+            idx = content.find('\n' + heading)
+            if idx >= 0:
+                offsets.append(idx + 1)
+
+        return min(offsets, default=-1)
+
+    def _get_date_range(self, chapters: List[ChapterMeta]) -> str:
+        """Get date range string for chapters."""
+        dates = [chapter.date for chapter in chapters if chapter.date]
         
         if not dates:
             return "Date range unknown"
@@ -411,10 +942,8 @@ class ReportGenerator:
         else:
             return f"{dates[0]} to {dates[-1]}"
     
-    def _extract_meeting_topic(self, summary: Dict) -> str:
-        """Extract meeting topic from summary data with fallbacks."""
-        # Try different sources for meeting topic
-        
+    def _topic_from_metadata(self, summary: Dict) -> Optional[str]:
+        """Get the meeting topic from summary fields alone, without reading the file."""
         # 1. Direct meeting_topic field
         if summary.get('meeting_topic') and summary['meeting_topic'] != 'Unknown':
             return summary['meeting_topic']
@@ -427,6 +956,23 @@ class ReportGenerator:
             if topic != 'Unknown':
                 return topic
         
+        return None
+    
+    def _extract_meeting_topic(self, summary: Dict) -> str:
+        """
+        Extract meeting topic from summary data with fallbacks.
+        
+        Args:
+            summary: Summary metadata
+            
+        Returns:
+            Meeting topic
+        """
+        # Try different sources for meeting topic
+        topic = self._topic_from_metadata(summary)
+        if topic:
+            return topic
+        
         # 3. Try to extract from summary file content
         summary_path = summary.get('summary_path')
         if summary_path:
@@ -435,30 +981,20 @@ class ReportGenerator:
                 topic = self._extract_topic_from_content(content)
                 if topic:
                     return topic
-            except:
-                pass
+            except IOError as e:
+                self.logger.debug(f"Could not read topic from {summary_path}: {str(e)}")
         
         # 4. Fallback to folder name or default
+        folder_name = summary.get('folder_name', '')
         return folder_name if folder_name else 'Meeting Session'
     
     def _clean_folder_name_for_topic(self, folder_name: str) -> str:
         """Clean folder name to extract meaningful topic."""
-        # Remove common date patterns
-        import re
-        
         # Remove date patterns like 20250815, 2025-08-15, etc.
-        cleaned = re.sub(r'\d{8}', '', folder_name)  # 20250815
-        cleaned = re.sub(r'\d{4}-\d{2}-\d{2}', '', cleaned)  # 2025-08-15
-        cleaned = re.sub(r'\d{2}-\d{2}-\d{4}', '', cleaned)  # 15-08-2025
-        cleaned = re.sub(r'\d{1,2}/\d{1,2}/\d{4}', '', cleaned)  # 8/15/2025
+        cleaned = DATE_PATTERN.sub('', folder_name)
         
-        # Remove leading/trailing separators
-        cleaned = re.sub(r'^[-_\s]+', '', cleaned)
-        cleaned = re.sub(r'[-_\s]+$', '', cleaned)
-        
-        # Replace underscores and multiple spaces with single spaces
-        cleaned = re.sub(r'[-_]+', ' ', cleaned)
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        # Collapse each separator run into a single space
+        cleaned = SEPARATOR_RUN_PATTERN.sub(' ', cleaned)
         
         # Capitalize words
         cleaned = cleaned.strip().title()
@@ -467,54 +1003,51 @@ class ReportGenerator:
     
     def _extract_topic_from_content(self, content: str) -> str:
         """Extract topic from summary content."""
-        lines = content.split('\n')
+        # Only the first 10 lines are inspected, so avoid splitting the whole file
+        lines = content.split('\n', 10)[:10]
         
         # Look for title line (first non-metadata line that looks like a title)
-        for line in lines[:10]:  # Check first 10 lines
+        for line in lines:
             line = line.strip()
             if (line and 
-                not line.startswith('#') and 
-                not line.startswith('**') and 
-                not line.startswith('-') and 
+                not line.startswith(NON_PROSE_PREFIXES) and 
                 not line.startswith('*This summary') and
                 len(line) > 10 and 
                 len(line) < 100 and
-                not ':' in line[-20:]):  # Avoid lines ending with colons (likely metadata)
+                line.rfind(':', max(0, len(line) - 20)) == -1):  # Avoid lines ending with colons (likely metadata)
                 # Clean the line
-                topic = re.sub(r'[*_`]', '', line)  # Remove markdown
-                topic = topic.replace(' - Meeting Summary', '')
-                topic = topic.replace(' Meeting Summary', '')
-                topic = topic.replace('Meeting Summary', '')
-                topic = topic.strip()
+                topic = line.translate(MARKDOWN_CHARS_TABLE)  # Remove markdown
+                topic = MEETING_SUFFIX_PATTERN.sub('', topic).strip()
                 if len(topic) > 5:
                     return topic
         
         return None
     
-    def _generate_markdown_slug(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_markdown_slug(text: str) -> str:
         """
         Generate markdown-compatible slug from text that matches how 
         markdown processors create anchor IDs from headings.
         
+        Cached, since the same headings are slugged for the TOC and again
+        across reports.
+        
         Args:
             text: The heading text to convert to a slug
             
         Returns:
             URL-safe slug string
         """
-        import re
-        
         # Convert to lowercase
         slug = text.lower()
         
-        # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
-        
-        # Remove or replace special characters (keep alphanumeric and hyphens)
-        slug = re.sub(r'[^a-z0-9-]', '', slug)
+        # Replace whitespace with hyphens and drop other special characters
+        # (keep alphanumeric and hyphens) in a single pass
+        slug = slug.translate(SLUG_TRANSLATION)
         
         # Remove multiple consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
+        slug = HYPHEN_RUN_PATTERN.sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
@@ -1,8 +1,18 @@
 """Template builder for creating AI prompts from configurable templates."""
 
+from string import Formatter
 from typing import Dict, List, Any, Optional
 from .config import Config
 
+# Rule placed between meetings in the combined summaries section of the global prompt
+COMBINED_SUMMARY_SEPARATOR = "\n\n" + "=" * 80 + "\n\n"
+
+# Placeholders each configurable template must define
+INDIVIDUAL_TEMPLATE_PLACEHOLDERS = ('instruction', 'requirements', 'format_instructions', 'context_info', 'transcript')
+GLOBAL_TEMPLATE_PLACEHOLDERS = ('instruction', 'required_sections', 'format_instructions',
+                                'meetings_overview', 'combined_summaries')
+INSTRUCTION_PLACEHOLDERS = ('summary_style',)
+
 
 class TemplateBuilder:
     """Handles AI prompt template creation and variable substitution."""
@@ -15,6 +25,20 @@ class TemplateBuilder:
             config: Configuration object with template definitions
         """
         self.config = config
+        
+        # Templates are fixed for the lifetime of the config, so resolve them
+        # once instead of walking the config dict on every prompt
+        self._individual_instruction_template = config.prompt_individual_summary_instruction
+        self._individual_instruction: Optional[str] = None
+        self._individual_format_instructions = config.prompt_individual_summary_format_instructions
+        self._individual_template = config.prompt_individual_summary_template
+        self._global_instruction = config.prompt_global_summary_instruction
+        self._global_format_instructions = config.prompt_global_summary_format_instructions
+        self._global_template = config.prompt_global_summary_template
+        
+        # Requirement and section lists depend only on config, so join them once too
+        self._individual_requirements = self._build_individual_requirements()
+        self._global_required_sections = "\n".join(config.prompt_global_summary_required_sections)
     
     def build_individual_summary_prompt(self, transcript: str, meeting_context: Optional[str] = None) -> str:
         """
@@ -27,30 +51,24 @@ class TemplateBuilder:
         Returns:
             Complete formatted prompt string
         """
-        # Get base instruction and substitute summary style
-        instruction = self.config.prompt_individual_summary_instruction.format(
-            summary_style=self.config.summary_style
-        )
-        
-        # Build requirements list based on config settings
-        requirements = self._build_individual_requirements()
-        
-        # Get format instructions
-        format_instructions = self.config.prompt_individual_summary_format_instructions
+        # Substitute summary style into the base instruction on first use, so a
+        # broken template only fails prompt building, as before
+        if self._individual_instruction is None:
+            self._individual_instruction = self._individual_instruction_template.format(
+                summary_style=self.config.summary_style
+            )
         
         # Build context info
-        context_info = f"Meeting Context: {meeting_context}\\n\\n" if meeting_context else ""
+        context_info = f"Meeting Context: {meeting_context}\n\n" if meeting_context else ""
         
         # Use the main template to combine everything
-        prompt = self.config.prompt_individual_summary_template.format(
-            instruction=instruction,
-            requirements=requirements,
-            format_instructions=format_instructions,
-            context_info=context_info,
-            transcript=transcript
-        )
-        
-        return prompt
+        return self._individual_template.format_map({
+            'instruction': self._individual_instruction,
+            'requirements': self._individual_requirements,
+            'format_instructions': self._individual_format_instructions,
+            'context_info': context_info,
+            'transcript': transcript
+        })
     
     def build_global_summary_prompt(self, summaries: List[Dict[str, Any]]) -> str:
         """
@@ -62,15 +80,6 @@ class TemplateBuilder:
         Returns:
             Complete formatted prompt string
         """
-        # Get instruction
-        instruction = self.config.prompt_global_summary_instruction
-        
-        # Get required sections and format them
-        required_sections = "\\n".join(self.config.prompt_global_summary_required_sections)
-        
-        # Get format instructions
-        format_instructions = self.config.prompt_global_summary_format_instructions
-        
         # Build meetings overview
         meetings_overview = self._build_meetings_overview(summaries)
         
@@ -78,15 +87,13 @@ class TemplateBuilder:
         combined_summaries = self._build_combined_summaries(summaries)
         
         # Use the main template to combine everything
-        prompt = self.config.prompt_global_summary_template.format(
-            instruction=instruction,
-            required_sections=required_sections,
-            format_instructions=format_instructions,
-            meetings_overview=meetings_overview,
-            combined_summaries=combined_summaries
-        )
-        
-        return prompt
+        return self._global_template.format_map({
+            'instruction': self._global_instruction,
+            'required_sections': self._global_required_sections,
+            'format_instructions': self._global_format_instructions,
+            'meetings_overview': meetings_overview,
+            'combined_summaries': combined_summaries
+        })
     
     def _build_individual_requirements(self) -> str:
         """
@@ -126,7 +133,7 @@ class TemplateBuilder:
         # Filter out any empty requirements
         requirements = [req for req in requirements if req]
         
-        return "\\n".join(requirements)
+        return "\n".join(requirements)
     
     def _build_meetings_overview(self, summaries: List[Dict[str, Any]]) -> str:
         """
@@ -142,12 +149,12 @@ class TemplateBuilder:
         
         for i, summary in enumerate(summaries, 1):
             overview = f"{i}. **{summary['meeting_topic']}** ({summary.get('meeting_date', 'Date unknown')})"
-            overview += f"\\n   - Duration: {summary.get('duration', 'Unknown')}"
-            overview += f"\\n   - Participants: {len(summary.get('participants', []))} people"
-            overview += f"\\n   - Key Topics: {len(summary.get('main_topics', []))} main areas"
+            overview += f"\n   - Duration: {summary.get('duration', 'Unknown')}"
+            overview += f"\n   - Participants: {len(summary.get('participants', []))} people"
+            overview += f"\n   - Key Topics: {len(summary.get('main_topics', []))} main areas"
             meetings_overview.append(overview)
         
-        return "\\n".join(meetings_overview)
+        return "\n".join(meetings_overview)
     
     def _build_combined_summaries(self, summaries: List[Dict[str, Any]]) -> str:
         """
@@ -164,9 +171,9 @@ class TemplateBuilder:
         for summary in summaries:
             header = f"MEETING: {summary['meeting_topic']} ({summary.get('meeting_date', 'Unknown date')})"
             content = summary['content']
-            combined_parts.append(f"{header}\\n{content}")
+            combined_parts.append(f"{header}\n{content}")
         
-        return "\\n\\n" + ("=" * 80 + "\\n\\n").join(combined_parts)
+        return "\n\n" + COMBINED_SUMMARY_SEPARATOR.join(combined_parts)
     
     def validate_templates(self) -> List[str]:
         """
@@ -177,26 +184,27 @@ class TemplateBuilder:
         """
         errors = []
         
-        # Validate individual summary template
-        individual_template = self.config.prompt_individual_summary_template
-        required_placeholders = ['instruction', 'requirements', 'format_instructions', 'context_info', 'transcript']
-        
-        for placeholder in required_placeholders:
-            if f'{{{placeholder}}}' not in individual_template:
-                errors.append(f"Individual summary template missing placeholder: {{{placeholder}}}")
-        
-        # Validate global summary template
-        global_template = self.config.prompt_global_summary_template
-        required_global_placeholders = ['instruction', 'required_sections', 'format_instructions', 
-                                       'meetings_overview', 'combined_summaries']
-        
-        for placeholder in required_global_placeholders:
-            if f'{{{placeholder}}}' not in global_template:
-                errors.append(f"Global summary template missing placeholder: {{{placeholder}}}")
+        checks = (
+            ("Individual summary template", self.config.prompt_individual_summary_template,
+             INDIVIDUAL_TEMPLATE_PLACEHOLDERS),
+            ("Global summary template", self.config.prompt_global_summary_template,
+             GLOBAL_TEMPLATE_PLACEHOLDERS),
+            ("Individual summary instruction", self.config.prompt_individual_summary_instruction,
+             INSTRUCTION_PLACEHOLDERS),
+        )
         
-        # Validate instruction template
-        instruction = self.config.prompt_individual_summary_instruction
-        if '{summary_style}' not in instruction:
-            errors.append("Individual summary instruction missing placeholder: {summary_style}")
+        for label, template, required_placeholders in checks:
+            # One parse of the template yields every placeholder it defines
+            try:
+                placeholders = {
+                    field_name for _, field_name, _, _ in Formatter().parse(template) if field_name
+                }
+            except ValueError as e:
+                errors.append(f"{label} is malformed: {str(e)}")
+                continue
+            
+            for placeholder in required_placeholders:
+                if placeholder not in placeholders:
+                    errors.append(f"{label} missing placeholder: {{{placeholder}}}")
         
         return errors
@@ -1,13 +1,34 @@
 """Transcript file parser for extracting meeting content from VTT files."""
 
+import asyncio
+import codecs
+import os
 import re
-import webvtt
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
 from .utils import time_to_seconds, seconds_to_time, setup_module_logger
 
+# Caption cleanup patterns, applied to every caption
+VTT_TAG_PATTERN = re.compile(r'<[^>]+>')
+SPEAKER_LABEL_PATTERN = re.compile(r'^([A-Za-z\s]+):\s*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+ANNOTATION_PATTERN = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+
+# Cue parsing, mirroring webvtt-py: blocks are separated by blank lines and a
+# cue's timing line is the first or second line of its block
+CUE_BLOCK_SEPARATOR = re.compile(r'\n\s*\n')
+CUE_TIMINGS_PATTERN = re.compile(r'\s*((?:\d+:)?\d{2}:\d{2}.\d{3})\s*-->\s*((?:\d+:)?\d{2}:\d{2}.\d{3})')
+# Valid timings already in webvtt-py's HH:MM:SS.mmm output form
+CUE_HMS_TIMINGS_PATTERN = re.compile(
+    r'\s*(\d{2}:[0-5]\d:[0-5]\d\.\d{3})\s*-->\s*(\d{2}:[0-5]\d:[0-5]\d\.\d{3})'
+)
+CUE_TEXT_TAG_PATTERN = re.compile(r'<.*?>')
+# Byte order marks of encodings other than UTF-8
+NON_UTF8_BOMS = (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
 
 @dataclass
 class TranscriptSegment:
@@ -17,6 +38,147 @@ class TranscriptSegment:
     text: str
     duration_seconds: Optional[float] = None
     original_text: Optional[str] = None  # Preserve original text with speaker info
+    start_seconds: Optional[float] = None
+    speaker: Optional[str] = None  # Name from a leading "Speaker:" label
+
+
+@dataclass(frozen=True)
+class ParsedCaptions:
+    """Parsed segments of one transcript plus their texts as a parallel column."""
+    segments: Tuple[TranscriptSegment, ...]
+    texts: Tuple[str, ...]  # texts[i] == segments[i].text
+
+
+def parse_transcript_file(transcript_path: str) -> Tuple[str, Dict[str, Any], List[TranscriptSegment]]:
+    """
+    Parse a transcript file with a fresh parser.
+    
+    Module-level so it can be shipped to worker processes.
+    
+    Args:
+        transcript_path: Path to the transcript file
+        
+    Returns:
+        Tuple of (full transcript, metadata dictionary, segments)
+    """
+    return TranscriptParser().parse_full(transcript_path)
+
+
+def parse_transcript_segments(transcript_path: str) -> List[TranscriptSegment]:
+    """
+    Parse a transcript file's segments with a fresh parser.
+    
+    Module-level so it can be shipped to worker processes.
+    
+    Args:
+        transcript_path: Path to the transcript file
+        
+    Returns:
+        List of TranscriptSegment objects
+    """
+    return TranscriptParser().parse_file(transcript_path)
+
+
+def _parse_captions(transcript_path: str) -> ParsedCaptions:
+    """
+    Read a transcript file and build its non-empty, cleaned segments.
+    
+    Args:
+        transcript_path: Path to the transcript file
+        
+    Returns:
+        ParsedCaptions with the segments and their text column
+    """
+    segments = []
+    texts = []
+    
+    cues = _read_cues(transcript_path)
+    if cues is None:
+        # webvtt-py is only loaded for files the cue reader leaves to it
+        import webvtt
+        cues = [(caption.start, caption.end, caption.text) for caption in webvtt.read(transcript_path)]
+    
+    for start, end, text in cues:
+        # Clean the text content, keeping the speaker label it strips;
+        # the result is already stripped
+        speaker, clean_text = TranscriptParser._clean_caption(text)
+        
+        if clean_text:  # Only add non-empty segments
+            start_seconds = time_to_seconds(start)
+            segment = TranscriptSegment(
+                start_time=start,
+                end_time=end,
+                text=clean_text,
+                duration_seconds=time_to_seconds(end) - start_seconds,
+                original_text=text.strip(),  # Original text, speaker label included
+                start_seconds=start_seconds,
+                speaker=speaker
+            )
+            segments.append(segment)
+            texts.append(clean_text)
+    
+    return ParsedCaptions(tuple(segments), tuple(texts))
+
+
+def _read_cues(transcript_path: str) -> Optional[List[Tuple[str, str, str]]]:
+    """
+    Read the cues of a VTT file without building webvtt-py caption objects.
+    
+    Produces the same start, end and text values as iterating webvtt.read.
+    Files outside the common layout (non UTF-8 byte order mark, missing
+    header, timings not in HH:MM:SS.mmm form, "-->" inside cue text) are
+    left to webvtt-py.
+    
+    Args:
+        transcript_path: Path to the transcript file
+        
+    Returns:
+        List of (start, end, text) tuples, or None if webvtt-py should parse the file
+    """
+    with open(transcript_path, 'rb') as f:
+        data = f.read()
+    if data.startswith(NON_UTF8_BOMS):
+        return None
+    
+    try:
+        content = data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return None
+    # Same newline handling as reading the file in text mode
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    if not content.startswith('WEBVTT'):
+        return None
+    
+    cues = []
+    for block in CUE_BLOCK_SEPARATOR.split(content):
+        lines = block.split('\n')
+        # Only the last block can end in blank lines
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if len(lines) < 2:
+            continue
+        
+        if '-->' in lines[0]:
+            timing_line, payload = lines[0], lines[1:]
+        elif len(lines) >= 3 and '-->' in lines[1]:
+            timing_line, payload = lines[1], lines[2:]
+        else:
+            continue
+        if '-->' in payload[0]:
+            continue
+        
+        timings = CUE_HMS_TIMINGS_PATTERN.match(timing_line)
+        if timings is None:
+            if CUE_TIMINGS_PATTERN.match(timing_line):
+                return None
+            continue
+        
+        text = '\n'.join(payload)
+        if '-->' in text:
+            return None
+        cues.append((timings.group(1), timings.group(2), CUE_TEXT_TAG_PATTERN.sub('', text)))
+    
+    return cues
 
 
 class TranscriptParser:
@@ -30,6 +192,9 @@ class TranscriptParser:
         """
         Parse a transcript file and extract content segments.
         
+        Blocks the calling thread while the file is parsed; from async code
+        use parse_file_async for large transcripts.
+        
         Args:
             transcript_path: Path to the transcript file
             
@@ -40,38 +205,54 @@ class TranscriptParser:
             FileNotFoundError: If VTT file doesn't exist
             ValueError: If VTT file is malformed
         """
-        transcript_file = Path(transcript_path)
-        if not transcript_file.exists():
-            raise FileNotFoundError(f"Transcript file not found: {transcript_path}")
+        return list(self._load_captions(transcript_path).segments)
+    
+    @classmethod
+    def parse_many(cls, transcript_paths: Sequence[str],
+                   max_workers: Optional[int] = None) -> List[List[TranscriptSegment]]:
+        """
+        Parse several transcript files in parallel worker processes.
         
-        try:
-            captions = webvtt.read(str(transcript_file))
-            segments = []
-            
-            for caption in captions:
-                # Store original text before cleaning
-                original_text = caption.text.strip()
-                
-                # Clean the text content
-                clean_text = self._clean_text(caption.text)
-                
-                if clean_text.strip():  # Only add non-empty segments
-                    segment = TranscriptSegment(
-                        start_time=caption.start,
-                        end_time=caption.end,
-                        text=clean_text,
-                        duration_seconds=time_to_seconds(caption.end) - 
-                                       time_to_seconds(caption.start),
-                        original_text=original_text
-                    )
-                    segments.append(segment)
-            
-            self.logger.info(f"Parsed {len(segments)} segments from {transcript_file.name}")
-            return segments
+        Args:
+            transcript_paths: Paths to the transcript files
+            max_workers: Number of worker processes (defaults to one per CPU,
+                at most one per file)
             
-        except Exception as e:
-            self.logger.error(f"Error parsing transcript file {transcript_path}: {str(e)}")
-            raise ValueError(f"Failed to parse transcript file: {str(e)}")
+        Returns:
+            Segment lists, in the same order as transcript_paths
+            
+        Raises:
+            FileNotFoundError: If a VTT file doesn't exist
+            ValueError: If a VTT file is malformed
+        """
+        paths = [str(path) for path in transcript_paths]
+        if len(paths) <= 1:
+            # Not worth starting a pool for a single file
+            return [cls().parse_file(path) for path in paths]
+        
+        workers = max_workers or min(os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_transcript_segments, paths))
+    
+    async def parse_file_async(self, transcript_path: str) -> List[TranscriptSegment]:
+        """
+        Parse a transcript file without blocking the running event loop.
+        
+        The parse runs in the loop's default thread pool, so other tasks keep
+        being served while a large transcript is read.
+        
+        Args:
+            transcript_path: Path to the transcript file
+            
+        Returns:
+            List of TranscriptSegment objects
+            
+        Raises:
+            FileNotFoundError: If VTT file doesn't exist
+            ValueError: If VTT file is malformed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.parse_file, transcript_path)
     
     def extract_full_transcript(self, transcript_path: str) -> str:
         """
@@ -83,15 +264,24 @@ class TranscriptParser:
         Returns:
             Complete transcript as a string
         """
-        segments = self.parse_file(transcript_path)
-        
-        # Combine all text segments
-        full_text = " ".join([segment.text for segment in segments if segment.text.strip()])
+        return self._join_texts(self._load_captions(transcript_path).texts)
+    
+    def parse_full(self, transcript_path: str) -> Tuple[str, Dict[str, Any], List[TranscriptSegment]]:
+        """
+        Parse a transcript file once and derive its text and metadata.
         
-        # Clean up extra whitespace
-        full_text = re.sub(r'\s+', ' ', full_text).strip()
+        Equivalent to calling extract_full_transcript, get_transcript_metadata
+        and parse_file, but reads and parses the file a single time.
         
-        return full_text
+        Args:
+            transcript_path: Path to the transcript file
+            
+        Returns:
+            Tuple of (full transcript, metadata dictionary, segments)
+        """
+        parsed = self._load_captions(transcript_path)
+        metadata = self._build_metadata(parsed, transcript_path)
+        return self._join_texts(parsed.texts), metadata, list(parsed.segments)
     
     def extract_transcript_with_timestamps(self, transcript_path: str, 
                                          timestamp_interval: int = 300) -> str:
@@ -105,24 +295,25 @@ class TranscriptParser:
         Returns:
             Transcript with timestamp markers
         """
-        segments = self.parse_file(transcript_path)
+        segments = self._load_captions(transcript_path).segments
         
         result = []
         last_timestamp_seconds = 0
         
         for segment in segments:
-            segment_start_seconds = time_to_seconds(segment.start_time)
+            # Start offsets are converted once, at parse time
+            segment_start_seconds = segment.start_seconds
             
             # Add timestamp marker if enough time has passed
             if segment_start_seconds - last_timestamp_seconds >= timestamp_interval:
-                result.append(f"\\n[{segment.start_time}]\\n")
+                result.append(f"\n[{segment.start_time}]\n")
                 last_timestamp_seconds = segment_start_seconds
             
             result.append(segment.text)
         
         return " ".join(result)
     
-    def get_transcript_metadata(self, transcript_path: str) -> Dict[str, any]:
+    def get_transcript_metadata(self, transcript_path: str) -> Dict[str, Any]:
         """
         Extract metadata about the transcript.
         
@@ -132,13 +323,69 @@ class TranscriptParser:
         Returns:
             Dictionary with transcript metadata
         """
-        segments = self.parse_file(transcript_path)
+        return self._build_metadata(self._load_captions(transcript_path), transcript_path)
+    
+    def _load_captions(self, transcript_path: str) -> ParsedCaptions:
+        """
+        Parse a transcript file into segments and their text column.
+        
+        Args:
+            transcript_path: Path to the transcript file
+            
+        Returns:
+            ParsedCaptions for the file
+            
+        Raises:
+            FileNotFoundError: If VTT file doesn't exist
+            ValueError: If VTT file is malformed
+        """
+        transcript_file = Path(transcript_path)
+        if not transcript_file.exists():
+            raise FileNotFoundError(f"Transcript file not found: {transcript_path}")
+        
+        try:
+            parsed = _parse_captions(str(transcript_file))
+            
+            self.logger.info(f"Parsed {len(parsed.segments)} segments from {transcript_file.name}")
+            return parsed
+            
+        except Exception as e:
+            self.logger.error(f"Error parsing transcript file {transcript_path}: {str(e)}")
+            raise ValueError(f"Failed to parse transcript file: {str(e)}")
+    
+    def _join_texts(self, texts: Sequence[str]) -> str:
+        """
+        Combine cleaned segment texts into a single transcript.
         
+        Args:
+            texts: Text of each transcript segment, as produced by _clean_text
+            
+        Returns:
+            Complete transcript as a string
+        """
+        # Cleaned texts are non-empty, stripped and single-spaced, so joining
+        # them already gives normalized whitespace; filter(None) guards the
+        # non-empty part without building another list
+        return " ".join(filter(None, texts))
+    
+    def _build_metadata(self, parsed: ParsedCaptions, transcript_path: str) -> Dict[str, Any]:
+        """
+        Compute transcript metadata from already parsed captions.
+        
+        Args:
+            parsed: Parsed segments and their text column
+            transcript_path: Path to the transcript file
+            
+        Returns:
+            Dictionary with transcript metadata
+        """
+        segments = parsed.segments
         if not segments:
             return {"duration_seconds": 0, "segment_count": 0, "word_count": 0}
         
         total_duration = time_to_seconds(segments[-1].end_time)
-        total_words = sum(len(segment.text.split()) for segment in segments)
+        # Cleaned texts are non-empty and single-spaced, so words = spaces + 1
+        total_words = len(parsed.texts) + sum(text.count(' ') for text in parsed.texts)
         
         # Try to identify potential speakers (simple heuristic)
         potential_speakers = self._identify_speakers(segments)
@@ -152,7 +399,8 @@ class TranscriptParser:
             "file_path": str(transcript_path)
         }
     
-    def _clean_text(self, text: str) -> str:
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """
         Clean VTT text content by removing formatting and artifacts.
         
@@ -162,20 +410,34 @@ class TranscriptParser:
         Returns:
             Cleaned text
         """
+        return TranscriptParser._clean_caption(text)[1]
+    
+    @staticmethod
+    def _clean_caption(text: str) -> Tuple[Optional[str], str]:
+        """
+        Clean VTT text content and pick out its speaker label.
+        
+        Args:
+            text: Raw text from VTT
+            
+        Returns:
+            Tuple of (speaker name or None, cleaned text)
+        """
         # Remove VTT formatting tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = VTT_TAG_PATTERN.sub('', text)
         
         # Remove speaker labels if they exist (format: "Speaker: text")
-        text = re.sub(r'^[A-Za-z\s]+:\s*', '', text)
-        
-        # Remove multiple spaces and normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        speaker = None
+        speaker_match = SPEAKER_LABEL_PATTERN.match(text)
+        if speaker_match:
+            speaker = speaker_match.group(1).strip() or None
+            text = text[speaker_match.end():]
         
-        # Remove common VTT artifacts
-        text = re.sub(r'\[.*?\]', '', text)  # Remove [background noise], etc.
-        text = re.sub(r'\(.*?\)', '', text)  # Remove (inaudible), etc.
+        # Remove common VTT artifacts: [background noise], (inaudible), etc.
+        text = ANNOTATION_PATTERN.sub('', text)
         
-        return text.strip()
+        # Remove multiple spaces and normalize whitespace, including gaps left above
+        return speaker, WHITESPACE_PATTERN.sub(' ', text).strip()
     
     
     def _identify_speakers(self, segments: List[TranscriptSegment]) -> List[str]:
@@ -188,12 +450,5 @@ class TranscriptParser:
         Returns:
             List of potential speaker identifiers
         """
-        speakers = set()
-        
-        for segment in segments:
-            # Look for speaker patterns at the beginning of segments
-            speaker_match = re.match(r'^([A-Za-z\s]+):\s*', segment.text)
-            if speaker_match:
-                speakers.add(speaker_match.group(1).strip())
-        
-        return list(speakers)
+        # Labels are picked out while cleaning, before they are stripped from the text
+        return list({segment.speaker for segment in segments if segment.speaker})
@@ -4,9 +4,24 @@ import os
 import re
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+# Write buffer large enough that a whole summary file goes out in one flush
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Summary fields and sections read back by extract_summary_info
+SUMMARY_DURATION_PATTERN = re.compile(r'- \*\*Duration\*\*: ([^\n]+)')
+SUMMARY_WORDS_PATTERN = re.compile(r'- \*\*Transcript Words\*\*: ([^\n]+)')
+SUMMARY_PARTICIPANTS_PATTERN = re.compile(r'## Participants\s*\n(.*?)\n\n', re.DOTALL)
+SUMMARY_TOPICS_PATTERN = re.compile(r'## Main Topics\s*\n(.*?)\n\n', re.DOTALL)
+SUMMARY_ACTIONS_PATTERN = re.compile(r'## Action Items\s*\n(.*?)(?:\n\n|\n## |\n---|\nTimeline)', re.DOTALL)
+BULLET_ITEM_PATTERN = re.compile(r'- ([^\n]+)')
+LIST_ITEM_PATTERN = re.compile(r'(?:\d+\.|-)\s*([^\n]+)')
+# First number in a transcript word count such as "1,234 words"
+WORD_COUNT_PATTERN = re.compile(r'([\d,]+)')
+
 
 def parse_folder_name(folder_name: str) -> Dict[str, str]:
     """
@@ -18,16 +33,39 @@ def parse_folder_name(folder_name: str) -> Dict[str, str]:
     Returns:
         Dictionary with parsed information
     """
-    if "_" in folder_name:
-        parts = folder_name.split("_", 1)
-        if len(parts) == 2:
-            date_part, topic_part = parts
-            return {
-                "date": date_part,
-                "topic": topic_part.replace("_", " ").title()
-            }
+    date_part, topic = _split_folder_name(folder_name)
+    return {"date": date_part, "topic": topic}
+
+
+@lru_cache(maxsize=1024)
+def _split_folder_name(folder_name: str) -> Tuple[Optional[str], str]:
+    """
+    Split a folder name into its date prefix and title-cased topic.
     
-    return {"date": None, "topic": folder_name.replace("_", " ").title()}
+    Args:
+        folder_name: Name of the folder
+        
+    Returns:
+        Tuple of (date or None, topic)
+    """
+    date_part, separator, topic_part = folder_name.partition("_")
+    if separator:
+        return date_part, topic_part.replace("_", " ").title()
+    return None, format_folder_title(folder_name)
+
+
+@lru_cache(maxsize=1024)
+def format_folder_title(folder_name: str) -> str:
+    """
+    Turn a folder name into a display title (e.g., "20250821_mulesoft" -> "20250821 Mulesoft").
+    
+    Args:
+        folder_name: Name of the folder
+        
+    Returns:
+        Title-cased folder name with underscores replaced by spaces
+    """
+    return folder_name.replace("_", " ").title()
 
 
 def extract_summary_info(content: str, folder_name: str) -> Dict[str, Any]:
@@ -42,36 +80,36 @@ def extract_summary_info(content: str, folder_name: str) -> Dict[str, Any]:
         Dictionary with extracted information
     """
     # Extract duration
-    duration_match = re.search(r'- \*\*Duration\*\*: ([^\n]+)', content)
+    duration_match = SUMMARY_DURATION_PATTERN.search(content)
     duration = duration_match.group(1) if duration_match else "Unknown"
     
     # Extract transcript word count
-    words_match = re.search(r'- \*\*Transcript Words\*\*: ([^\n]+)', content)
+    words_match = SUMMARY_WORDS_PATTERN.search(content)
     transcript_words = words_match.group(1) if words_match else "Unknown"
     
     # Extract participants (simple extraction)
-    participants_section = re.search(r'## Participants\s*\n(.*?)\n\n', content, re.DOTALL)
+    participants_section = SUMMARY_PARTICIPANTS_PATTERN.search(content)
     participants = []
     if participants_section:
         participant_text = participants_section.group(1)
         # Extract names from bullet points
-        participant_matches = re.findall(r'- ([^\n]+)', participant_text)
+        participant_matches = BULLET_ITEM_PATTERN.findall(participant_text)
         participants = [p.strip() for p in participant_matches]
     
     # Extract main topics
-    topics_section = re.search(r'## Main Topics\s*\n(.*?)\n\n', content, re.DOTALL)
+    topics_section = SUMMARY_TOPICS_PATTERN.search(content)
     main_topics = []
     if topics_section:
         topics_text = topics_section.group(1)
-        topic_matches = re.findall(r'(?:\d+\.|-)\s*([^\n]+)', topics_text)
+        topic_matches = LIST_ITEM_PATTERN.findall(topics_text)
         main_topics = [t.strip() for t in topic_matches]
     
     # Extract action items
-    action_section = re.search(r'## Action Items\s*\n(.*?)(?:\n\n|\n## |\n---|\nTimeline)', content, re.DOTALL)
+    action_section = SUMMARY_ACTIONS_PATTERN.search(content)
     action_items = []
     if action_section:
         action_text = action_section.group(1)
-        action_matches = re.findall(r'(?:\d+\.|-)\s*([^\n]+)', action_text)
+        action_matches = LIST_ITEM_PATTERN.findall(action_text)
         action_items = [a.strip() for a in action_matches]
     
     return {
@@ -83,8 +121,9 @@ def extract_summary_info(content: str, folder_name: str) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4096)
 def time_to_seconds(time_str: str) -> float:
-    """Convert VTT time format to seconds."""
+    """Convert VTT time format to seconds (memoized; cue boundaries repeat)."""
     try:
         # Format: HH:MM:SS.mmm or MM:SS.mmm
         parts = time_str.split(':')
@@ -135,7 +174,7 @@ def safe_write_file(file_path: Path, content: str, encoding: str = 'utf-8') -> N
         IOError: If writing fails
     """
     try:
-        with open(file_path, 'w', encoding=encoding) as f:
+        with open(file_path, 'w', encoding=encoding, buffering=WRITE_BUFFER_SIZE) as f:
             f.write(content)
     except Exception as e:
         raise IOError(f"Failed to write file {file_path}: {str(e)}")
@@ -174,8 +213,12 @@ def calculate_total_transcript_words(summaries: List[Dict[str, Any]]) -> int:
     """
     total_words = 0
     for summary in summaries:
-        words_str = summary.get('transcript_words', '0')
-        words_match = re.search(r'([\d,]+)', str(words_str).replace(',', ''))
+        words_str = str(summary.get('transcript_words', '0')).replace(',', '')
+        # Counts are normally plain digits; only search for a number otherwise
+        if words_str.isdecimal():
+            total_words += int(words_str)
+            continue
+        words_match = WORD_COUNT_PATTERN.search(words_str)
         if words_match:
             try:
                 total_words += int(words_match.group(1))